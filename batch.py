@@ -0,0 +1,102 @@
+"""
+Solve many Boggle boards at once with a single walk of the dictionary trie.
+
+Solving boards one at a time repeats the same work at the top of the trie
+for every board. The lockstep solver walks the trie once instead. At each
+trie node it keeps every search state still alive on any board - which
+board, which cell the path ends on, and which cells the path has used -
+and moves all of them to a child node together. A prefix that no board can
+extend is dropped for the whole batch in one step.
+
+solve_boards spreads chunks of a batch over a pool of threads or
+processes. The solver keeps no state between calls and the shared
+dictionary is frozen, so threads are safe; on a free-threaded CPython
+build they also run in parallel.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import result_codec
+from boggle import Boggle, neighbor_table
+
+POOLS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+
+def find_words_batch(games, dictionary=None):
+    """Return a list with the set of words found on each game's board.
+
+    games is a sequence of Boggle instances, which may differ in size. The
+    result matches calling find_words() on each game, in order. All boards
+    are solved against one dictionary: the given trie, or else the first
+    game's dictionary.
+    """
+    games = list(games)
+    found = [set() for _ in games]
+    if not games:
+        return found
+    if dictionary is None:
+        dictionary = games[0].dictionary
+
+    letters = [[ch for row in game.board for ch in row] for game in games]
+    neighbors = [neighbor_table(game.size) for game in games]
+
+    # A state is (board index, cell index, bitmask of cells used by the path).
+    starts = {}
+    for b, board in enumerate(letters):
+        for cell, letter in enumerate(board):
+            starts.setdefault(letter, set()).add((b, cell, 1 << cell))
+
+    def descend(node, path, states):
+        if node.is_end_of_word and len(path) > 2:
+            for b in {state[0] for state in states}:
+                found[b].add(path)
+
+        children = node.children
+        advanced = {}
+        for b, cell, used in states:
+            board = letters[b]
+            for n in neighbors[b][cell]:
+                if used >> n & 1:
+                    continue
+                letter = board[n]
+                if letter in children:
+                    advanced.setdefault(letter, set()).add((b, n, used | 1 << n))
+
+        for letter, next_states in advanced.items():
+            descend(children[letter], path + letter, next_states)
+
+    for letter, states in starts.items():
+        if letter in dictionary.root.children:
+            descend(dictionary.root.children[letter], letter, states)
+    return found
+
+
+def solve_chunk(boards, size=4, encoded=False):
+    """Solve a list of board letter strings against the shared dictionary.
+
+    With encoded, each board's words come back as result_codec bytes.
+    """
+    games = [Boggle(size=size, letters=letters) for letters in boards]
+    results = find_words_batch(games)
+    if encoded and games:
+        return [result_codec.encode_words(words, games[0].dictionary) for words in results]
+    return results
+
+
+def solve_boards(boards, size=4, workers=None, pool="thread", chunk_size=64, encoded=False):
+    """Return the set of words on each board, solving chunks in a worker pool.
+
+    boards is a sequence of letter strings for size x size boards. pool is
+    "thread" or "process"; each process loads its own copy of the
+    dictionary when it starts, while threads share one. With encoded, the
+    results are result_codec bytes instead of sets, which are far cheaper
+    to send back from worker processes.
+    """
+    boards = list(boards)
+    chunks = [boards[i:i + chunk_size] for i in range(0, len(boards), chunk_size)]
+    initializer = Boggle.load_shared_dictionary if pool == "process" else None
+    with POOLS[pool](max_workers=workers, initializer=initializer) as executor:
+        results = executor.map(
+            solve_chunk, chunks, [size] * len(chunks), [encoded] * len(chunks)
+        )
+        return [words for chunk in results for words in chunk]
@@ -0,0 +1,97 @@
+"""
+Load generator for the Boggle HTTP server.
+
+    boggle-http --port 8080 &
+    python benchmarks/http_load.py --port 8080 --connections 32 --requests 200
+
+Each connection is kept alive and sends its requests one after another,
+alternating random-board solves with word validations. Reports client-side
+throughput and latency, then the server's own /metrics.
+"""
+
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+import click
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from boggle_http import percentile  # noqa: E402
+
+BOARDS = ["lntoeprostienesi", "toessinelreixdly", "abcdefghijklmnop", "quietsarenotlouds"]
+WORDS = ["pro", "tie", "lento", "sine", "rein", "zebra"]
+
+
+async def request(reader, writer, method, path, payload=None):
+    """Send one request on an open connection and return (status, json body)."""
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+        + body
+    )
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    status_line, *header_lines = head.decode("latin-1").split("\r\n")
+    length = 0
+    for line in header_lines:
+        if line.lower().startswith("content-length:"):
+            length = int(line.split(":", 1)[1])
+    return int(status_line.split()[1]), json.loads(await reader.readexactly(length))
+
+
+async def client(host, port, count, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for n in range(count):
+            letters = random.choice(BOARDS)
+            if n % 2:
+                payload = {"letters": letters, "word": random.choice(WORDS)}
+                path = "/validate"
+            else:
+                payload = {"letters": letters}
+                path = "/solve"
+            start = time.perf_counter()
+            status, _ = await request(reader, writer, "POST", path, payload)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def run(host, port, connections, requests):
+    latencies, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        client(host, port, requests, latencies, errors) for _ in range(connections)
+    ))
+    elapsed = time.perf_counter() - start
+    reader, writer = await asyncio.open_connection(host, port)
+    _, metrics = await request(reader, writer, "GET", "/metrics")
+    writer.close()
+    return elapsed, latencies, errors, metrics
+
+
+@click.command()
+@click.option("--host", default="127.0.0.1")
+@click.option("--port", type=int, default=8080)
+@click.option("--connections", type=int, default=32)
+@click.option("--requests", type=int, default=200, help="Requests per connection.")
+def cli(host, port, connections, requests):
+    """Drive concurrent keep-alive traffic at a running boggle-http server."""
+    elapsed, latencies, errors, metrics = asyncio.run(run(host, port, connections, requests))
+    click.echo(f"{len(latencies)} requests in {elapsed:.2f}s: {len(latencies) / elapsed:.0f} req/s")
+    click.echo(
+        f"client p50 {percentile(latencies, 0.5) * 1000:.1f} ms, "
+        f"p99 {percentile(latencies, 0.99) * 1000:.1f} ms, errors {len(errors)}"
+    )
+    click.echo(f"server metrics: {json.dumps(metrics)}")
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,49 @@
+"""
+Compare thread-pool and process-pool throughput for batch solving.
+
+    python benchmarks/pools.py --boards 2000 --workers 1 --workers 4
+
+On a standard CPython build the GIL keeps threads from running the solver
+in parallel, so only processes scale. On a free-threaded build (3.13t and
+later) threads scale too, without each worker loading its own dictionary.
+"""
+
+import os
+import random
+import sys
+import time
+
+import click
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from batch import solve_boards  # noqa: E402
+from boggle import Boggle  # noqa: E402
+
+
+def random_boards(count, size, seed):
+    """Return count random boards as letter strings, rolled from the Boggle dice."""
+    random.seed(seed)
+    return ["".join(ch for row in Boggle(size=size).board for ch in row) for _ in range(count)]
+
+
+@click.command()
+@click.option("--boards", type=int, default=2000)
+@click.option("--size", type=int, default=4)
+@click.option("--workers", type=int, multiple=True, default=(1, 2, 4))
+@click.option("--chunk-size", type=int, default=64)
+def cli(boards, size, workers, chunk_size):
+    """Time solve_boards with thread and process pools."""
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    click.echo(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    letters = random_boards(boards, size, seed=1)
+    for pool in ("thread", "process"):
+        for count in workers:
+            start = time.perf_counter()
+            solve_boards(letters, size=size, workers=count, pool=pool, chunk_size=chunk_size)
+            elapsed = time.perf_counter() - start
+            click.echo(f"{pool:>7} x{count}: {boards / elapsed:8.0f} boards/s ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    cli()
@@ -19,22 +19,91 @@ The trie.py program is provided to format dictionaries.
 
 """
 import click
+import threading
+import time
+from collections import namedtuple
+from functools import cached_property, lru_cache
+from heapq import nsmallest
 from itertools import repeat
 import random
-from helpers import normalize_qu, boggle_dice
+import result_codec
+from helpers import normalize_qu, boggle_dice, score_for_length
+from profiling import MODES, Profiler
+from sharded_dictionary import ShardedDictionary
 from trie import Trie, TrieNode
 
 DIRECTIONS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
 
 
+@lru_cache(maxsize=None)
+def neighbor_table(size):
+    """Return, for each cell index of a size x size board, its neighbor indexes."""
+    table = []
+    for x in range(size):
+        for y in range(size):
+            table.append(tuple(
+                (x + dx) * size + (y + dy)
+                for dx, dy in DIRECTIONS
+                if 0 <= x + dx < size and 0 <= y + dy < size
+            ))
+    return tuple(table)
+
+# Ways to rank words for top_words. Each maps a word length to a rank.
+RANKINGS = {
+    "length": lambda length: length,
+    "score": score_for_length,
+}
+
+STRATEGIES = ("auto", "board", "dictionary")
+
+# Result of find_words_within. state is None when the search finished;
+# otherwise pass it back as resume= to carry on where it stopped.
+SearchResult = namedtuple("SearchResult", ["words", "truncated", "stats", "state"])
+
+# find_words_within reads the clock only once per this many trie nodes.
+CLOCK_INTERVAL = 1024
+
+# Cost model for plan_strategy, in rough microseconds of CPython time.
+# Fitted by timing both strategies over board sizes 4-100 and random
+# dictionaries of 1 word up to the full word list.
+BOARD_COST_EXPONENT = 0.6  # DFS work per cell grows sublinearly with dictionary size
+BOARD_COST_SCALE = 1.0
+BOARD_COST_CAP = 300  # ...and levels off once most letter pairs are live prefixes
+INDEX_COST = 0.7  # building letter_cells, per cell
+SETUP_COST = 150  # fixed overhead of a dictionary-driven solve
+PATH_COST = 60  # find_path, per starting cell tried
+ALPHABET_SIZE = 26
+WORD_SPREAD = 6  # how fast the share of spellable words drops as letters go missing
+
+
 @click.command()
 @click.option("--size", type=int, default=4)
+@click.option("--top", type=int, default=None, help="Show only the best N words.")
+@click.option("--key", type=click.Choice(sorted(RANKINGS)), default="length")
+@click.option("--strategy", type=click.Choice(STRATEGIES), default="auto")
+@click.option("--shards", type=click.Path(exists=True, file_okay=False), default=None,
+              help="Load only the needed first-letter shards from this directory.")
+@click.option("--profile", type=click.Choice(MODES), default=None,
+              help="Profile CPU time or memory use and print a summary to stderr.")
+@click.option("--profile-out", default="boggle-profile", show_default=True,
+              help="Prefix for the .pstats / .snapshot files written by --profile.")
 @click.argument("letters", nargs=-1, type=str)
-def cli(letters, size):
+def cli(letters, size, top, key, strategy, shards, profile, profile_out):
     """Run the Boggle solver from the command line."""
-    game = Boggle(letters=letters, size=size)
+    with Profiler(profile, profile_out) as profiler:
+        dictionary = ShardedDictionary(shards) if shards else None
+        game = Boggle(letters=letters, size=size, dictionary=dictionary)
+        profiler.mark("load")
+        if top is not None:
+            words = game.top_words(top, key=key)
+        else:
+            words = game.find_words(strategy=strategy)
+        profiler.mark("solve")
     game.display_board()
-    words = game.find_words()
+    if top is not None:
+        click.secho(f"Top {len(words)} words by {key}:", fg="yellow")
+        click.secho(words)
+        return
     click.secho(f"{len(words)} words found:", fg="yellow")
     click.secho(sorted(words, key=len))
 
@@ -43,11 +112,13 @@ class Boggle:
     """solve the classic Boggle word game by Parker Brothers"""
 
     # the boggle dictionary is large, and slow to load.
-    # Share a single copy among all instances.
+    # Share a single, frozen copy among all instances and threads.
     dictionary = Trie()
+    _dictionary_lock = threading.Lock()
 
-    def __init__(self, size=4, letters=None):
+    def __init__(self, size=4, letters=None, dictionary=None, dice=boggle_dice):
         self.size = size
+        self.dice = dice
         if self.size < 2:
             raise ValueError("Board size too small")
 
@@ -55,10 +126,36 @@ class Boggle:
             self.board = self.form_board(self.load(letters))
         else:
             self.board = self.form_board(self.generate_random_boggle_letters())
-        self.visited = self.form_board(repeat(False))
 
-        if not self.dictionary:
-            self.dictionary = Trie.load_from_file()
+        if isinstance(dictionary, ShardedDictionary):
+            dictionary = dictionary.for_letters(self.letter_cells)
+        if dictionary is None:
+            # Pin the current shared dictionary, so a hot swap takes effect for
+            # new boards without changing the words of this one mid-solve.
+            dictionary = type(self).dictionary or self.load_shared_dictionary()
+        self.dictionary = dictionary
+
+    @classmethod
+    def load_shared_dictionary(cls):
+        """Load the shared dictionary once, however many threads ask at the same time."""
+        with cls._dictionary_lock:
+            if not cls.dictionary:
+                cls.dictionary = Trie.load_from_file().freeze()
+        return cls.dictionary
+
+    @classmethod
+    def swap_dictionary(cls, trie):
+        """Make trie the shared dictionary for boards created from now on."""
+        with cls._dictionary_lock:
+            cls.dictionary = trie.freeze()
+
+    @classmethod
+    def update_dictionary(cls, added=(), removed=()):
+        """Swap in a copy of the shared dictionary with words added and removed."""
+        cls.load_shared_dictionary()
+        with cls._dictionary_lock:
+            cls.dictionary = cls.dictionary.with_delta(added, removed).freeze()
+        return cls.dictionary
 
     def load(self, raw_chars):
         """Parse user input into boggle-normalized letters."""
@@ -78,35 +175,51 @@ class Boggle:
 
     def generate_random_boggle_letters(self):
         """Yield random letters by rolling each Boggle cube in shuffled order."""
-        cubes = list(boggle_dice)  # copy to avoid modifying the original
+        cubes = list(self.dice)  # copy to avoid modifying the original
         random.shuffle(cubes)
         while True:
             for cube in cubes:
                 yield random.choice(cube)
 
-    def find_words(self):
-        """Return the set of all dictionary words found on the board."""
+    def find_words(self, strategy="auto"):
+        """Return the set of all dictionary words found on the board.
+
+        strategy chooses how: "board" walks the board following the trie,
+        "dictionary" checks dictionary words against the board, and "auto"
+        lets plan_strategy() pick the cheaper one. All give the same words.
+
+        Scratch state lives in each call, so several threads may solve the
+        same board at once.
+        """
+        if strategy == "auto":
+            strategy = self.plan_strategy()
+        if strategy == "dictionary":
+            return self.find_words_by_dictionary()
+        if strategy != "board":
+            raise ValueError(f"Unknown strategy {strategy!r}")
+
         found_words = set()
+        visited = self.form_board(repeat(False))
+        candidates = self.dictionary.root.children
         for i in range(self.size):
             for j in range(self.size):
                 first_letter = self.board[i][j]
-                candidates = self.dictionary.root.children
                 if first_letter in candidates:
                     self.search_word(
-                        i, j, candidates[first_letter], first_letter, found_words
+                        i, j, candidates[first_letter], first_letter, found_words, visited
                     )
         return found_words
 
-    def search_word(self, x, y, node, path, found_words):
+    def search_word(self, x, y, node, path, found_words, visited):
         """Recursively explore adjacent cells to find words via DFS."""
         is_on_grid = (0 <= x < self.size) and (0 <= y < self.size)
-        if not is_on_grid or self.visited[x][y]:
+        if not is_on_grid or visited[x][y]:
             return
 
         if node.is_end_of_word and len(path) > 2:
             found_words.add(path)
 
-        self.visited[x][y] = True
+        visited[x][y] = True
 
         for dx, dy in DIRECTIONS:
             nx, ny = x + dx, y + dy
@@ -116,24 +229,240 @@ class Boggle:
                 continue
 
             next_letter = self.board[nx][ny]
-            if next_letter in node.children and not self.visited[nx][ny]:
+            if next_letter in node.children and not visited[nx][ny]:
                 self.search_word(
                     nx,
                     ny,
                     node.children[next_letter],
                     path + next_letter,
                     found_words,
+                    visited,
                 )
-        self.visited[x][y] = False
+        visited[x][y] = False
+
+    def find_words_within(self, time_budget=None, node_budget=None, max_results=None, resume=None):
+        """Find words like find_words, but stop when a budget runs out.
+
+        time_budget is in seconds, node_budget counts trie nodes visited,
+        and max_results caps the number of words. The result's state holds
+        the pending search paths and the words found so far, as plain data.
+        Passing it back as resume continues the search with fresh budgets.
+        The search is an explicit-stack DFS. Each pending path carries its
+        own bitmask of used cells, so the stack alone is enough to resume.
+        """
+        start = time.perf_counter()
+        size = self.size
+        letters = [letter for row in self.board for letter in row]
+        neighbors = neighbor_table(size)
+        dictionary = self.dictionary
+        if resume is None:
+            found_words = set()
+            stack = [
+                (cell // size, cell % size, letter, 1 << cell)
+                for cell, letter in reversed(list(enumerate(letters)))
+                if letter in dictionary.root.children
+            ]
+        else:
+            found_words = set(resume["words"])
+            stack = [tuple(entry) for entry in resume["stack"]]
+        # The state is saved as (x, y, path, used); the loop works on flat cell
+        # indexes, and looks each path's trie node up again.
+        stack = [(x * size + y, path, used, dictionary._walk(path)) for x, y, path, used in stack]
+
+        # All budgets are checked in one place, reached only when visits hits
+        # checkpoint, so the loop pays a single comparison per trie node.
+        never = float("inf")
+        deadline = never if time_budget is None else start + time_budget
+        node_limit = never if node_budget is None else node_budget
+        result_limit = never if max_results is None else max_results
+        clock_step = never if time_budget is None else CLOCK_INTERVAL
+        visits = 0
+        checkpoint = 0
+        truncated = False
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            if visits >= checkpoint:
+                if (
+                    visits >= node_limit
+                    or len(found_words) >= result_limit
+                    or (deadline < never and time.perf_counter() >= deadline)
+                ):
+                    truncated = True
+                    break
+                checkpoint = min(node_limit, visits + clock_step)
+
+            cell, path, used, node = pop()
+            visits += 1
+            if node.is_end_of_word and len(path) > 2 and path not in found_words:
+                found_words.add(path)
+                if len(found_words) >= result_limit:
+                    checkpoint = visits
+            children = node.children
+            if not children:
+                continue
+            # Pushed in reverse so paths pop in the same order find_words visits them.
+            for n in reversed(neighbors[cell]):
+                if used >> n & 1:
+                    continue
+                child = children.get(letters[n])
+                if child is not None:
+                    push((n, path + letters[n], used | 1 << n, child))
+
+        stats = {
+            "nodes": visits,
+            "seconds": time.perf_counter() - start,
+            "words": len(found_words),
+            "pending": len(stack),
+        }
+        state = None
+        if truncated:
+            state = {
+                "words": sorted(found_words),
+                "stack": [(cell // size, cell % size, path, used) for cell, path, used, _ in stack],
+            }
+        return SearchResult(found_words, truncated, stats, state)
+
+    def find_words_by_dictionary(self):
+        """Return the words of find_words() by locating dictionary words on the board.
+
+        Only trie branches spelled entirely with letters on the board are
+        walked, and each word reached is checked with find_path.
+        """
+        found_words = set()
+        stack = [(self.dictionary.root, "")]
+        while stack:
+            node, prefix = stack.pop()
+            if node.is_end_of_word and len(prefix) > 2 and self.find_path(prefix):
+                found_words.add(prefix)
+            for letter, child in node.children.items():
+                if letter in self.letter_cells:
+                    stack.append((child, prefix + letter))
+        return found_words
+
+    def estimate_costs(self):
+        """Return the estimated cost of each find_words strategy.
+
+        Walking the board costs work per cell that rises with the size of
+        the dictionary. Walking the dictionary costs an index over the
+        cells, plus a path search for each dictionary word the board's
+        letters can spell, from each cell showing its first letter.
+        """
+        cells = self.size * self.size
+        word_count = len(self.dictionary)
+        per_cell = min(BOARD_COST_SCALE * word_count**BOARD_COST_EXPONENT, BOARD_COST_CAP)
+
+        distinct = len({letter for row in self.board for letter in row})
+        spellable = word_count * min(1.0, distinct / ALPHABET_SIZE) ** WORD_SPREAD
+        starts_per_word = cells / distinct
+        return {
+            "board": cells * per_cell,
+            "dictionary": (
+                SETUP_COST + cells * INDEX_COST + spellable * starts_per_word * PATH_COST
+            ),
+        }
+
+    def plan_strategy(self):
+        """Return the name of the cheaper find_words strategy for this board."""
+        costs = self.estimate_costs()
+        return min(costs, key=costs.get)
+
+    def top_words(self, k, key="length"):
+        """Return the k best words on the board, best first.
+
+        Words are ranked by length or by Boggle score, ties broken alphabetically.
+        """
+        if k <= 0:
+            return []
+        rank = RANKINGS[key]
+        return nsmallest(k, self.find_words(), key=lambda word: (-rank(len(word)), word))
+
+    @cached_property
+    def letter_cells(self):
+        """Map each letter on the board to the list of cells showing it."""
+        cells = {}
+        for i, row in enumerate(self.board):
+            for j, letter in enumerate(row):
+                cells.setdefault(letter, []).append((i, j))
+        return cells
+
+    def find_path(self, word):
+        """Return the list of (row, col) cells spelling word, or None.
+
+        Only the word itself is searched: each step looks up the cells
+        showing the next letter in letter_cells and keeps the ones adjacent
+        to the current cell (or, when a letter is common on a big board,
+        checks the eight neighbors instead). The cost depends on the word
+        rather than on the whole board or the dictionary, which is not
+        consulted.
+        """
+        try:
+            letters = list(normalize_qu(word.lower()))
+        except ValueError:
+            return None
+        if not letters or any(ch not in self.letter_cells for ch in letters):
+            return None
+
+        path = []
+
+        def extend(index, x, y):
+            path.append((x, y))
+            if index == len(letters) - 1:
+                return True
+            next_letter = letters[index + 1]
+            cells = self.letter_cells[next_letter]
+            if len(cells) > len(DIRECTIONS):
+                cells = [
+                    (x + dx, y + dy)
+                    for dx, dy in DIRECTIONS
+                    if 0 <= x + dx < self.size
+                    and 0 <= y + dy < self.size
+                    and self.board[x + dx][y + dy] == next_letter
+                ]
+            for nx, ny in cells:
+                is_adjacent = max(abs(nx - x), abs(ny - y)) == 1
+                if is_adjacent and (nx, ny) not in path and extend(index + 1, nx, ny):
+                    return True
+            path.pop()
+            return False
+
+        for x, y in self.letter_cells[letters[0]]:
+            if extend(0, x, y):
+                return path
+        return None
+
+    def contains_word(self, word):
+        """Return True if word would be among the results of find_words()."""
+        word = word.lower()
+        return (
+            len(word) > 2
+            and self.find_path(word) is not None
+            and self.dictionary.search(word)
+        )
+
+    def find_word_ids(self):
+        """Return the sorted dictionary IDs of the words on the board."""
+        if not self.dictionary.word_list:
+            raise ValueError("Dictionary has no word IDs; rebuild it with make_trie_dict.py")
+        return sorted(self.dictionary.word_id(word) for word in self.find_words())
+
+    def to_bytes(self, layout="auto"):
+        """Return the words on the board in the compact result_codec format."""
+        return result_codec.encode(
+            self.find_word_ids(), len(self.dictionary.word_list), layout, self.dictionary.fingerprint
+        )
 
-    def to_dict(self):
+    def to_dict(self, strategy="auto"):
         """Return the board and found words as a serializable dictionary."""
-        words = self.find_words()
+        if strategy == "auto":
+            strategy = self.plan_strategy()
+        words = self.find_words(strategy=strategy)
         return {
             "board": self.board,
             "size": self.size,
             "words": sorted(words, key=len),
             "count": len(words),
+            "strategy": strategy,
         }
 
     def display_board(self):
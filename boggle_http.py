@@ -0,0 +1,455 @@
+"""HTTP/JSON server exposing Boggle tools for game backends.
+
+## Usage: boggle-http [OPTIONS]
+
+Endpoints (all JSON):
+    POST /solve          {"letters": "lntoeprostienesi", "size": 4}
+    POST /validate       {"letters": "...", "size": 4, "word": "pro"}
+    POST /is-boggleable  {"word": "sweater"}
+    GET  /metrics
+
+With --dictionary PATH the server uses that word list (or trie .pkl) and
+reloads it on SIGHUP, or whenever the file changes if --watch is given.
+Requests already running finish on the old dictionary.
+
+Concurrent solve requests are collected into micro-batches: the first
+request opens a short window, and everything that arrives before it closes
+(or until the batch is full) is solved together by find_words_batch on a
+worker pool that loaded the dictionary at startup. Connections are kept
+alive between requests.
+
+Load-test with `python benchmarks/http_load.py`.
+"""
+
+import asyncio
+import json
+import os
+import signal
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+import click
+
+from batch import find_words_batch
+from boggle import Boggle
+from helpers import word_score
+from hot_reload import DictionaryWatcher, load_dictionary, reload_dictionary, report, report_error
+from is_boggleable import can_form_word
+
+POOLS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Content Too Large", 431: "Request Header Fields Too Large",
+}
+# A full solve grows with the square of the board size and holds a worker
+# (and the rest of its micro-batch) until done; 20x20 takes about 0.4s.
+MAX_SIZE = 20
+MAX_BODY = 64 * 1024
+
+
+def percentile(values, fraction):
+    """Return the value at the given fraction (0-1) of a list of numbers, or 0.0."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def solve_requests(requests):
+    """Solve a micro-batch of (letters, size) requests; runs in a pool worker.
+
+    Returns one result per request: the board and its words, or an error
+    message if the letters could not form a board. A bad request only
+    fails itself, never the rest of its batch.
+    """
+    results = [None] * len(requests)
+    games = {}
+    for i, (letters, size) in enumerate(requests):
+        try:
+            games[i] = Boggle(size=size, letters=letters or None)
+        except ValueError as error:
+            results[i] = {"error": str(error)}
+        except Exception as error:
+            results[i] = {"error": f"{type(error).__name__}: {error}"}
+    for i, words in zip(games, find_words_batch(games.values())):
+        results[i] = {
+            "board": games[i].board,
+            "size": games[i].size,
+            "words": sorted(words, key=len),
+            "count": len(words),
+        }
+    return results
+
+
+def field(body, name, kind, default=None):
+    """Return body[name], or default if it is absent, checking it is a kind.
+
+    Raises KeyError if a field without a default is missing, and TypeError
+    if the value has the wrong type.
+    """
+    if name not in body and default is not None:
+        return default
+    value = body[name]
+    if not isinstance(value, kind) or (kind is int and isinstance(value, bool)):
+        raise TypeError(f"{name!r} must be {kind.__name__}, not {type(value).__name__}")
+    return value
+
+
+def board_size(body):
+    """Return the requested board size, checking it is between 2 and MAX_SIZE."""
+    size = field(body, "size", int, 4)
+    if not 2 <= size <= MAX_SIZE:
+        raise ValueError(f"'size' must be between 2 and {MAX_SIZE}, not {size}")
+    return size
+
+
+def worker_pid():
+    """A no-op pool task that reports which process ran it."""
+    time.sleep(0.01)
+    return os.getpid()
+
+
+def validate_word(letters, size, word):
+    """Check one player's word against a board; runs in a pool worker."""
+    game = Boggle(size=size, letters=letters)
+    valid = game.contains_word(word)
+    return {
+        "word": word,
+        "valid": valid,
+        "path": game.find_path(word) if valid else None,
+        "score": word_score(word) if valid else 0,
+    }
+
+
+class MicroBatcher:
+    """Group solve requests that arrive close together into one pool call."""
+
+    def __init__(self, executor, window=0.005, max_batch=64):
+        self.executor = executor
+        self.window = window
+        self.max_batch = max_batch
+        self.pending = []
+        self.flush_handle = None
+        self.batches = 0
+        self.batched_requests = 0
+
+    def submit(self, letters, size):
+        """Queue a solve and return a future for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append(((letters, size), future))
+        if len(self.pending) >= self.max_batch:
+            self.flush()
+        elif self.flush_handle is None:
+            self.flush_handle = loop.call_later(self.window, self.flush)
+        return future
+
+    def flush(self):
+        """Send everything queued so far to the pool as one batch."""
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        if not self.pending:
+            return
+        batch, self.pending = self.pending, []
+        self.batches += 1
+        self.batched_requests += len(batch)
+        loop = asyncio.get_running_loop()
+        work = loop.run_in_executor(self.executor, solve_requests, [item for item, _ in batch])
+        work.add_done_callback(lambda done: self._deliver(batch, done))
+
+    @staticmethod
+    def _deliver(batch, done):
+        error = done.exception()
+        results = [error] * len(batch) if error else done.result()
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+class BoggleServer:
+    """Asyncio HTTP/1.1 server answering solve, validate and boggleability requests."""
+
+    def __init__(
+        self, workers=None, pool="thread", window=0.005, max_batch=64, history=10_000,
+        dictionary=None,
+    ):
+        self.workers = workers
+        self.pool = pool
+        self.scratch = []
+        self.executor = self.start_pool(dictionary)
+        self.batcher = MicroBatcher(self.executor, window=window, max_batch=max_batch)
+        self.reloads = 0
+        self.last_reload_seconds = None
+        self.latencies = deque(maxlen=history)
+        self.in_flight = 0
+        self.requests = 0
+        self.server = None
+        self.routes = {
+            ("POST", "/solve"): self.solve,
+            ("POST", "/validate"): self.validate,
+            ("POST", "/is-boggleable"): self.is_boggleable,
+            ("GET", "/metrics"): self.metrics,
+        }
+
+    def start_pool(self, dictionary=None):
+        """Create a worker pool with the dictionary (the default one if None) loaded.
+
+        Process workers load it as they start; await warm() before use. A
+        word list is built into a trie here, once, and handed to them as a
+        temporary .pkl that drop_scratch() removes once they have read it.
+        """
+        if self.pool == "process" and dictionary and Path(dictionary).suffix != ".pkl":
+            handle, pickled = tempfile.mkstemp(suffix=".pkl")
+            os.close(handle)
+            load_dictionary(dictionary).save_to_file(pickled)
+            self.scratch.append(pickled)
+            dictionary = pickled
+        load = partial(reload_dictionary, dictionary) if dictionary else Boggle.load_shared_dictionary
+        if self.pool == "process":
+            return ProcessPoolExecutor(max_workers=self.workers or os.cpu_count(), initializer=load)
+        load()
+        return ThreadPoolExecutor(max_workers=self.workers)
+
+    def drop_scratch(self):
+        """Delete temporary dictionary files that every worker has loaded."""
+        while self.scratch:
+            Path(self.scratch.pop()).unlink(missing_ok=True)
+
+    async def warm(self, executor):
+        """Wait until every worker of a process pool is up with its dictionary loaded.
+
+        ProcessPoolExecutor only starts workers on the first submit, so this
+        keeps sending no-op tasks until each worker has answered one.
+        Returns the worker PIDs seen (none for a thread pool).
+        """
+        seen = set()
+        if not isinstance(executor, ProcessPoolExecutor):
+            return seen
+        loop = asyncio.get_running_loop()
+        workers = self.workers or os.cpu_count()
+        while len(seen) < workers:
+            seen.update(await asyncio.gather(
+                *(loop.run_in_executor(executor, worker_pid) for _ in range(workers))
+            ))
+        return seen
+
+    async def reload(self, dictionary):
+        """Switch to the dictionary at path; return the seconds it took.
+
+        Thread workers share Boggle's dictionary, which is swapped in place.
+        Process workers each hold a copy, so a new pool is started and
+        warmed while the old one keeps serving; then it is swapped in and
+        the old one is retired once its running batches finish. The time
+        reported includes the warm-up.
+        """
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        if self.pool == "process":
+            executor = await loop.run_in_executor(None, self.start_pool, dictionary)
+            await self.warm(executor)
+            self.drop_scratch()
+            old, self.executor = self.executor, executor
+            self.batcher.executor = executor
+            old.shutdown(wait=False)
+        else:
+            await loop.run_in_executor(None, reload_dictionary, dictionary)
+        self.reloads += 1
+        self.last_reload_seconds = time.perf_counter() - start
+        return self.last_reload_seconds
+
+    async def start(self, host="127.0.0.1", port=8080):
+        """Warm the worker pool, start listening and return the bound (host, port)."""
+        await self.warm(self.executor)
+        self.drop_scratch()
+        self.server = await asyncio.start_server(self.handle_connection, host, port)
+        return self.server.sockets[0].getsockname()[:2]
+
+    async def close(self):
+        """Stop accepting connections and shut down the worker pool."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.drop_scratch()
+
+    async def solve(self, body):
+        letters = field(body, "letters", str, "")
+        size = board_size(body)
+        result = await self.batcher.submit(letters, size)
+        if "error" in result:
+            return 400, result
+        return 200, result
+
+    async def validate(self, body):
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            self.executor, validate_word,
+            field(body, "letters", str), board_size(body), field(body, "word", str),
+        )
+        return 200, result
+
+    async def is_boggleable(self, body):
+        loop = asyncio.get_running_loop()
+        word = field(body, "word", str)
+        return 200, {"word": word, "boggleable": await loop.run_in_executor(
+            self.executor, can_form_word, word
+        )}
+
+    async def metrics(self, body):
+        latencies = list(self.latencies)
+        batches = self.batcher.batches
+        return 200, {
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "queue_depth": len(self.batcher.pending),
+            "latency_ms": {
+                "p50": percentile(latencies, 0.50) * 1000,
+                "p99": percentile(latencies, 0.99) * 1000,
+            },
+            "batches": batches,
+            "mean_batch_size": self.batcher.batched_requests / batches if batches else 0.0,
+            "dictionary_reloads": self.reloads,
+            "last_reload_seconds": self.last_reload_seconds,
+        }
+
+    async def dispatch(self, method, path, body):
+        """Route one request and return (status, payload)."""
+        handler = self.routes.get((method, path))
+        if handler is None:
+            known_path = any(route_path == path for _, route_path in self.routes)
+            return (405, {"error": "method not allowed"}) if known_path else (404, {"error": "not found"})
+        try:
+            payload = json.loads(body) if body else {}
+            if not isinstance(payload, dict):
+                raise TypeError("request body must be a JSON object")
+            return await handler(payload)
+        except (ValueError, KeyError, TypeError) as error:
+            return 400, {"error": f"{type(error).__name__}: {error}"}
+
+    @staticmethod
+    async def respond(writer, status, payload, keep_alive):
+        """Write one JSON response."""
+        data = json.dumps(payload).encode()
+        writer.write(
+            f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode()
+            + data
+        )
+        await writer.drain()
+
+    async def handle_connection(self, reader, writer):
+        """Serve requests on one keep-alive connection until the client closes it."""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.LimitOverrunError:
+                    await self.respond(writer, 431, {"error": "request headers too large"}, False)
+                    break
+                start = time.perf_counter()
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                headers = {}
+                for line in header_lines:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+                try:
+                    method, path, version = request_line.split(" ", 2)
+                    length = int(headers.get("content-length", 0))
+                    if length < 0:
+                        raise ValueError(f"negative Content-Length {length}")
+                except ValueError as error:
+                    # Without a usable request line or length the stream can't be resynced.
+                    await self.respond(writer, 400, {"error": f"malformed request: {error}"}, False)
+                    break
+                if length > MAX_BODY:
+                    await self.respond(writer, 413, {"error": f"body over {MAX_BODY} bytes"}, False)
+                    break
+                body = await reader.readexactly(length)
+
+                self.in_flight += 1
+                try:
+                    status, payload = await self.dispatch(method, path.split("?", 1)[0], body)
+                finally:
+                    self.in_flight -= 1
+
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                await self.respond(writer, status, payload, keep_alive)
+                self.requests += 1
+                self.latencies.append(time.perf_counter() - start)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass  # the client went away mid-request; there is no one to answer
+        finally:
+            writer.close()
+
+
+@click.command()
+@click.option("--host", default="127.0.0.1")
+@click.option("--port", type=int, default=8080)
+@click.option("--workers", type=int, default=None)
+@click.option("--pool", type=click.Choice(sorted(POOLS)), default="process")
+@click.option("--window-ms", type=float, default=5.0, help="Micro-batch collection window.")
+@click.option("--max-batch", type=int, default=64)
+@click.option("--dictionary", type=click.Path(exists=True), default=None,
+              help="Word list or trie .pkl to serve; reloaded on SIGHUP.")
+@click.option("--watch", is_flag=True, help="Reload the dictionary when its file changes.")
+def cli(host, port, workers, pool, window_ms, max_batch, dictionary, watch):
+    """Run the Boggle HTTP/JSON server."""
+
+    async def serve():
+        server = BoggleServer(
+            workers=workers, pool=pool, window=window_ms / 1000, max_batch=max_batch,
+            dictionary=dictionary,
+        )
+        bound_host, bound_port = await server.start(host, port)
+        click.secho(f"Serving on http://{bound_host}:{bound_port}", fg="yellow")
+
+        loop = asyncio.get_running_loop()
+        watcher = None
+        if dictionary:
+            async def reload_and_report():
+                try:
+                    seconds = await server.reload(dictionary)
+                except Exception as error:
+                    report_error(dictionary, error)
+                else:
+                    report(dictionary, seconds)
+
+            if hasattr(signal, "SIGHUP"):
+                loop.add_signal_handler(signal.SIGHUP, lambda: loop.create_task(reload_and_report()))
+            if watch:
+                watcher = DictionaryWatcher(
+                    dictionary,
+                    reload=lambda path: asyncio.run_coroutine_threadsafe(
+                        server.reload(path), loop
+                    ).result(),
+                )
+                watcher.start()
+        try:
+            await server.server.serve_forever()
+        finally:
+            if watcher:
+                watcher.stop()
+            await server.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    cli()
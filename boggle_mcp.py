@@ -1,27 +1,59 @@
-"""MCP server exposing Boggle tools: solve a board and check if a word is boggleable."""
+"""MCP server exposing Boggle tools: solve a board and check if a word is boggleable.
 
+Set BOGGLE_PROFILE=cpu or BOGGLE_PROFILE=mem to profile each solve_boggle
+call; files are written as <BOGGLE_PROFILE_OUT>-<call number>.*.
+"""
+
+import itertools
 import json
+import os
 from mcp.server.fastmcp import FastMCP
 from boggle import Boggle
 from is_boggleable import can_form_word
+from profiling import Profiler
 
 mcp = FastMCP("Boggle")
+PROFILE = os.environ.get("BOGGLE_PROFILE") or None
+PROFILE_OUT = os.environ.get("BOGGLE_PROFILE_OUT", "boggle-mcp-profile")
+calls = itertools.count(1)
 
 
 @mcp.tool()
-def solve_boggle(letters: str = "", size: int = 4) -> str:
+def solve_boggle(
+    letters: str = "",
+    size: int = 4,
+    time_budget: float = 10.0,
+    node_budget: int = 5_000_000,
+    max_words: int = 0,
+) -> str:
     """Generate and/or solve a Boggle board.
 
     If letters are provided, solves that board. If omitted, generates a
     random board by rolling the official Boggle dice, then solves it.
-    Returns the board layout and all valid words found.
+    Returns the board layout and all valid words found. If a budget runs
+    out first, returns the words found so far with "truncated" set.
 
     Args:
         letters: Board letters (e.g. "lntoeprostienesi"). Leave empty to generate a random board.
         size: Board dimension (default 4 for a 4x4 grid).
+        time_budget: Seconds to search before giving up (default 10).
+        node_budget: Maximum search steps (default 5,000,000).
+        max_words: Stop after this many words (0 for no limit).
     """
-    game = Boggle(letters=letters or None, size=size)
-    return json.dumps(game.to_dict(), indent=2)
+    with Profiler(PROFILE, f"{PROFILE_OUT}-{next(calls)}") as profiler:
+        game = Boggle(letters=letters or None, size=size)
+        profiler.mark("load")
+        result = game.find_words_within(
+            time_budget=time_budget, node_budget=node_budget, max_results=max_words or None
+        )
+    return json.dumps({
+        "board": game.board,
+        "size": game.size,
+        "words": sorted(result.words, key=len),
+        "count": len(result.words),
+        "truncated": result.truncated,
+        "stats": result.stats,
+    }, indent=2)
 
 
 @mcp.tool()
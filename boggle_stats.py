@@ -0,0 +1,248 @@
+#!/usr/bin/python
+"""Monte Carlo statistics over random Boggle boards
+
+## Usage: boggle-stats [OPTIONS]
+
+## Example
+    `boggle-stats --boards 100000 --dice pre1987 --checkpoint run1.json`
+    `boggle-stats --merge run1.json --merge run2.json`
+
+Rolls random boards from a dice set (modern, pre1987, or a file with one
+die per line), solves them in parallel, and reports how often each word
+appears and how word counts and scores are distributed.
+
+Aggregates are plain counters: per-word appearance counts and histograms
+of words and points per board. Their size depends on the dictionary, not
+on how many boards are rolled. They are checkpointed to JSON as the run
+goes, so an interrupted run resumes where it stopped. Runs made
+independently can be merged. Each run records its seed (random unless
+--seed is given), and merging refuses runs that share one, since those
+rolled the same boards.
+"""
+
+import json
+import math
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import click
+
+from batch import find_words_batch
+from boggle import Boggle
+from helpers import boggle_dice, pre1987_boggle_dice, word_score
+
+DICE_SETS = {"modern": boggle_dice, "pre1987": pre1987_boggle_dice}
+
+
+def load_dice(name):
+    """Return a named dice set, or read one from a file with one die per line.
+
+    In a file, a die is either six letters ("aeaneg") or six faces
+    separated by spaces ("n u i h m qu").
+    """
+    if name in DICE_SETS:
+        return DICE_SETS[name]
+    dice = []
+    for line in Path(name).read_text().splitlines():
+        line = line.strip().lower()
+        if line:
+            dice.append(tuple(line.split()) if " " in line else line)
+    return dice
+
+
+class WordStats:
+    """Streaming counters over solved boards; merge-able and JSON-serializable."""
+
+    def __init__(self):
+        self.boards = 0
+        self.seeds = set()  # seeds of the runs counted here
+        self.word_boards = Counter()  # word -> number of boards it appeared on
+        self.word_counts = Counter()  # words on a board -> number of boards
+        self.scores = Counter()  # points on a board -> number of boards
+
+    def add(self, words):
+        """Count one solved board."""
+        self.boards += 1
+        self.word_boards.update(words)
+        self.word_counts[len(words)] += 1
+        self.scores[sum(word_score(word) for word in words)] += 1
+
+    def merge(self, other):
+        """Add another run's counters into this one and return self.
+
+        Raises ValueError if both count a run with the same seed, which
+        would count the same boards twice.
+        """
+        shared = self.seeds & other.seeds
+        if shared:
+            raise ValueError(f"Both statistics include runs with seed {min(shared)}")
+        self.seeds |= other.seeds
+        self.boards += other.boards
+        self.word_boards.update(other.word_boards)
+        self.word_counts.update(other.word_counts)
+        self.scores.update(other.scores)
+        return self
+
+    def probability(self, word):
+        """Return the fraction of boards on which word appeared."""
+        return self.word_boards[word] / self.boards if self.boards else 0.0
+
+    def most_common(self, n=10):
+        """Return the n most common words with their appearance probabilities."""
+        return [(word, count / self.boards) for word, count in self.word_boards.most_common(n)]
+
+    @staticmethod
+    def summary(histogram):
+        """Return mean, standard deviation, min and max of a value -> count histogram."""
+        total = sum(histogram.values())
+        if not total:
+            return {"mean": 0.0, "stdev": 0.0, "min": 0, "max": 0}
+        mean = sum(value * count for value, count in histogram.items()) / total
+        variance = sum(count * (value - mean) ** 2 for value, count in histogram.items()) / total
+        return {"mean": mean, "stdev": math.sqrt(variance), "min": min(histogram), "max": max(histogram)}
+
+    def to_dict(self):
+        return {
+            "boards": self.boards,
+            "seeds": sorted(self.seeds),
+            "word_boards": dict(self.word_boards),
+            "word_counts": {str(k): v for k, v in self.word_counts.items()},
+            "scores": {str(k): v for k, v in self.scores.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.boards = data["boards"]
+        stats.seeds = set(data.get("seeds", ()))
+        stats.word_boards = Counter(data["word_boards"])
+        stats.word_counts = Counter({int(k): v for k, v in data["word_counts"].items()})
+        stats.scores = Counter({int(k): v for k, v in data["scores"].items()})
+        return stats
+
+
+def save_checkpoint(path, stats, settings, next_chunk):
+    """Write the aggregate so far, plus what is needed to resume the run."""
+    data = {"settings": settings, "next_chunk": next_chunk, "stats": stats.to_dict()}
+    temporary = Path(f"{path}.tmp")
+    temporary.write_text(json.dumps(data))
+    temporary.replace(path)
+
+
+def load_checkpoint(path):
+    """Return (stats, settings, next_chunk) from a checkpoint file."""
+    data = json.loads(Path(path).read_text())
+    return WordStats.from_dict(data["stats"]), data.get("settings"), data.get("next_chunk", 0)
+
+
+def run_chunk(boards, size, dice, seed, chunk=0):
+    """Roll and solve boards for chunk number chunk of the run seeded seed.
+
+    The generator is seeded from both, so no two (seed, chunk) pairs share
+    boards, not even seed s chunk 1 and seed s + 1 chunk 0.
+    """
+    random.seed(f"{seed}/{chunk}")
+    games = [Boggle(size=size, dice=dice) for _ in range(boards)]
+    stats = WordStats()
+    for words in find_words_batch(games):
+        stats.add(words)
+    return stats
+
+
+def simulate(boards, size=4, dice="modern", seed=None, workers=None, chunk_size=500,
+             checkpoint=None, on_chunk=None):
+    """Solve boards random boards in parallel and return the merged WordStats.
+
+    Chunk i is always rolled from (seed, i), so a run is reproducible. With
+    no seed a random one is picked. If checkpoint names an existing file
+    from the same settings, the run resumes from it (and its seed); the
+    file is rewritten after every finished chunk.
+    """
+    saved, saved_settings, first_chunk = None, None, 0
+    if checkpoint and Path(checkpoint).exists():
+        saved, saved_settings, first_chunk = load_checkpoint(checkpoint)
+        if seed is None and saved_settings:
+            seed = saved_settings.get("seed")
+    if seed is None:
+        seed = random.randrange(2**32)
+    settings = {"boards": boards, "size": size, "dice": dice, "seed": seed, "chunk_size": chunk_size}
+    if saved is None:
+        stats = WordStats()
+        stats.seeds.add(seed)
+    elif saved_settings != settings:
+        differing = [key for key in settings if (saved_settings or {}).get(key) != settings[key]]
+        raise ValueError(
+            f"Checkpoint {checkpoint} was made with different settings ({', '.join(differing)})"
+        )
+    else:
+        stats = saved
+
+    chunks = math.ceil(boards / chunk_size)
+    sizes = [min(chunk_size, boards - i * chunk_size) for i in range(first_chunk, chunks)]
+    die_set = load_dice(dice)
+    with ProcessPoolExecutor(max_workers=workers, initializer=Boggle.load_shared_dictionary) as executor:
+        results = executor.map(
+            run_chunk,
+            sizes,
+            [size] * len(sizes),
+            [die_set] * len(sizes),
+            [seed] * len(sizes),
+            range(first_chunk, chunks),
+        )
+        for chunk, result in enumerate(results, start=first_chunk + 1):
+            stats.merge(result)
+            if checkpoint:
+                save_checkpoint(checkpoint, stats, settings, chunk)
+            if on_chunk:
+                on_chunk(stats)
+    return stats
+
+
+def report(stats, top):
+    """Print a summary of the statistics."""
+    click.secho(f"{stats.boards} boards (seeds {', '.join(map(str, sorted(stats.seeds)))})", fg="yellow")
+    for label, histogram in (("words per board", stats.word_counts), ("points per board", stats.scores)):
+        s = WordStats.summary(histogram)
+        click.echo(f"{label}: mean {s['mean']:.1f}, stdev {s['stdev']:.1f}, range {s['min']}-{s['max']}")
+    click.secho(f"Top {top} words by probability of appearing:", fg="yellow")
+    for word, probability in stats.most_common(top):
+        click.echo(f"  {word:<12} {probability:.4f}")
+
+
+@click.command()
+@click.option("--boards", type=int, default=10_000)
+@click.option("--size", type=int, default=4)
+@click.option("--dice", default="modern", help="modern, pre1987, or a file with one die per line.")
+@click.option("--seed", type=int, default=None, help="Random unless given; recorded in the output.")
+@click.option("--workers", type=int, default=None)
+@click.option("--chunk-size", type=int, default=500)
+@click.option("--checkpoint", type=click.Path(dir_okay=False), default=None,
+              help="Save progress here after each chunk, and resume from it.")
+@click.option("--merge", "merge_files", multiple=True, type=click.Path(exists=True),
+              help="Report on merged checkpoint files instead of running.")
+@click.option("--out", type=click.Path(dir_okay=False), default=None,
+              help="Write the merged statistics to this file.")
+@click.option("--top", type=int, default=20)
+def cli(boards, size, dice, seed, workers, chunk_size, checkpoint, merge_files, out, top):
+    """Gather word statistics over random Boggle boards."""
+    if merge_files:
+        stats = WordStats()
+        for path in merge_files:
+            try:
+                stats.merge(load_checkpoint(path)[0])
+            except ValueError as error:
+                raise click.BadParameter(f"{path}: {error}", param_hint="--merge")
+    else:
+        try:
+            stats = simulate(boards, size, dice, seed, workers, chunk_size, checkpoint)
+        except ValueError as error:
+            raise click.UsageError(str(error))
+    if out:
+        save_checkpoint(out, stats, None, None)
+    report(stats, top)
+
+
+if __name__ == "__main__":
+    cli()
@@ -40,4 +40,33 @@ def normalize_qu(text):
                 raise ValueError("'Q' without a 'u'.")
             yield "qu"
         else:
-            yield char
\ No newline at end of file
+            yield char
+
+
+def score_for_length(length):
+    """Return the official Boggle points for a word of the given length.
+
+    Words of three or four letters are worth 1 point, and longer words
+    earn more. 'Qu' counts as two letters.
+
+    >>> [score_for_length(n) for n in range(2, 9)]
+    [0, 1, 1, 2, 3, 5, 11]
+    """
+    if length < 3:
+        return 0
+    if length <= 4:
+        return 1
+    if length <= 6:
+        return length - 3
+    if length == 7:
+        return 5
+    return 11
+
+
+def word_score(word):
+    """Return the official Boggle points for a word.
+
+    >>> word_score("quiet")
+    2
+    """
+    return score_for_length(len(word))
@@ -0,0 +1,146 @@
+"""
+Update the shared Boggle dictionary in a running process.
+
+Boards pin the dictionary they were created with, so swapping
+Boggle.dictionary is atomic from a solver's point of view: solves already
+under way finish on the old version and new boards use the new one.
+
+- apply_changes adds and bans words. It copies only the changed trie
+  paths, so it takes milliseconds.
+- reload_dictionary replaces the whole dictionary from a word list or a
+  trie.pkl file.
+- DictionaryWatcher reloads when a file changes, and reload_on_signal
+  reloads on SIGHUP.
+
+Each of these reports how long the rebuild took. A reload that fails is
+reported and the old dictionary stays in place.
+"""
+
+import signal
+import threading
+import time
+from pathlib import Path
+
+import click
+
+from boggle import Boggle
+from make_trie_dict import build
+from trie import Trie
+
+
+def report(source, seconds):
+    """Default reload callback: note the reload on stderr."""
+    click.echo(f"Reloaded dictionary from {source} in {seconds:.3f}s", err=True)
+
+
+def report_error(source, error):
+    """Default failure callback: note the failed reload on stderr."""
+    click.secho(f"Could not reload dictionary from {source}: {error}", fg="red", err=True)
+
+
+def load_dictionary(path):
+    """Return a frozen trie built from a word list, or loaded from a .pkl file."""
+    path = Path(path)
+    if path.suffix == ".pkl":
+        trie = Trie.load_from_file(path)
+    else:
+        trie = build(path.read_text().split())
+    return trie.freeze()
+
+
+def reload_dictionary(path):
+    """Replace the shared dictionary with the one at path; return the seconds taken."""
+    start = time.perf_counter()
+    Boggle.swap_dictionary(load_dictionary(path))
+    return time.perf_counter() - start
+
+
+def apply_changes(added=(), removed=()):
+    """Add and remove words in the shared dictionary; return the seconds taken."""
+    start = time.perf_counter()
+    Boggle.update_dictionary(added, removed)
+    return time.perf_counter() - start
+
+
+class DictionaryWatcher(threading.Thread):
+    """Background thread that reloads the dictionary whenever a file changes.
+
+    reload is called with the path and returns the seconds it took; a
+    server whose workers hold their own dictionaries can pass its own.
+    A change is only picked up once the file's mtime and size have held
+    still for one interval, so a file that is still being written is not
+    loaded half-way. If reload raises, on_error gets the exception and the
+    reload is retried at the next check.
+    """
+
+    def __init__(self, path, interval=1.0, reload=reload_dictionary, on_reload=report,
+                 on_error=report_error):
+        super().__init__(daemon=True)
+        self.path = Path(path)
+        self.interval = interval
+        self.reload = reload
+        self.on_reload = on_reload
+        self.on_error = on_error
+        self.stopped = threading.Event()
+        self.last_modified = self._modified()
+        self.pending = None
+
+    def _modified(self):
+        """Return (mtime, size) of the file, or None if it is missing."""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def check(self):
+        """Reload if the file changed and has settled; return True if it did."""
+        modified = self._modified()
+        if modified is None or modified == self.last_modified:
+            self.pending = None
+            return False
+        if modified != self.pending:
+            self.pending = modified
+            return False
+        try:
+            seconds = self.reload(self.path)
+        except Exception as error:
+            self.on_error(self.path, error)
+            return False
+        self.last_modified = modified
+        self.pending = None
+        self.on_reload(self.path, seconds)
+        return True
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.check()
+
+    def stop(self):
+        self.stopped.set()
+
+
+def reload_on_signal(path, signum=None, on_reload=report, on_error=report_error):
+    """Reload the dictionary from path whenever the process receives signum.
+
+    signum defaults to SIGHUP, which Windows lacks; pass another signal
+    there. The reload runs on its own thread so the signal handler returns
+    at once.
+    """
+    if signum is None:
+        signum = getattr(signal, "SIGHUP", None)
+        if signum is None:
+            raise ValueError("This platform has no SIGHUP; pass signum explicitly")
+
+    def reload_in_background():
+        try:
+            seconds = reload_dictionary(path)
+        except Exception as error:
+            on_error(path, error)
+        else:
+            on_reload(path, seconds)
+
+    def handler(received, frame):
+        threading.Thread(target=reload_in_background, daemon=True).start()
+
+    signal.signal(signum, handler)
@@ -1,63 +1,159 @@
 #!/usr/bin/python
 """
 Check if a word can be formed using the letters on a Boggle board.
+
+With the standard dice this is exact: a word fits on some 4x4 board exactly
+when distinct dice can spell it (see can_form_word).
 """
 
+import math
+from collections import namedtuple
+
 import click
 from helpers import normalize_qu, boggle_dice
+from profiling import MODES, Profiler
+from trie import signature
 
 # Convert each die into a set of faces (lowercased).
 # String dice become single-char sets; the tuple die preserves "qu" as one face.
 dice_faces = [{face.lower() for face in die} for die in boggle_dice]
 
+# For each face, the indexes of the dice that show it.
+dice_for_face = {}
+for die, faces in enumerate(dice_faces):
+    for face in faces:
+        dice_for_face.setdefault(face, []).append(die)
+
+
+Placement = namedtuple("Placement", "board dice path")
+
+
+def assign_dice(chars):
+    """Return the index of a distinct die for each char, or None if there is none.
+
+    Each die may only be used once, so this is a bipartite matching between
+    letters and dice. Each letter in turn takes a free die showing it or,
+    failing that, bumps a die's current owner onto another die that shows
+    the owner's letter (an augmenting path). A letter that cannot be placed
+    this way cannot be placed at all, so there is no exponential
+    backtracking. A word fails after at most 16 short searches.
+    """
+    if len(chars) > len(dice_faces):
+        return None
+    owner = {}  # die index -> index of the char it spells
+
+    def augment(index, seen):
+        for die in dice_for_face.get(chars[index], ()):
+            if die not in seen:
+                seen.add(die)
+                if die not in owner or augment(owner[die], seen):
+                    owner[die] = index
+                    return True
+        return False
+
+    for index in range(len(chars)):
+        if not augment(index, set()):
+            return None
+    assignment = [None] * len(chars)
+    for die, index in owner.items():
+        assignment[index] = die
+    return assignment
+
+
+def snake_path(size=4):
+    """Return every (row, col) cell of a size x size board, each adjacent to the last."""
+    return [
+        (row, col if row % 2 == 0 else size - 1 - col)
+        for row in range(size)
+        for col in range(size)
+    ]
+
 
 def can_form_word(word):
     """Return True if the word can be spelled using the 16 Boggle dice.
 
-    Each die may only be used once. This is a constraint-satisfaction problem:
-    assign one die to each letter such that no die is reused. A backtracking
-    search tries each available die for the current letter, recurses on the
-    rest of the word, and undoes the choice if it leads to a dead end.
+    Each die may only be used once. The grid adds no further constraint:
+    dice can be placed in any cell, and the snake path visits all 16
+    cells, each adjacent to the last. So any word the dice can spell can
+    be laid out along that path, and this check is exact for the board
+    too. place_word returns such a layout.
     """
     try:
         chars = list(normalize_qu(word.lower()))
     except ValueError:
         return False
+    return assign_dice(chars) is not None
 
-    def backtrack(index, used):
-        """Recursively assign dice to letters starting at index.
-
-        Backtracking works by making a tentative choice (marking a die as
-        used), then exploring whether the remaining letters can be satisfied.
-        If they can't, the choice is undone (the die is removed from 'used')
-        and the next candidate die is tried. This exhaustive search guarantees
-        a solution is found if one exists.
-        """
-        if index == len(chars):
-            return True
-        char = chars[index]
-
-        # Iterate over each die face
-        for i, face in enumerate(dice_faces):
-            if i not in used and char in face:
-                # Use this die face
-                used.add(i)
-                if backtrack(index + 1, used):
-                    return True
-                # Backtrack
-                used.remove(i)
 
-        return False
+def place_word(word):
+    """Return a Placement proving word can appear on a 4x4 board, or None.
+
+    board is the 16 faces in row order; dice gives the die used for each
+    letter; path gives the (row, col) cell of each letter, as find_path
+    reports them. Dice not used by the word show their first face.
+    """
+    try:
+        chars = list(normalize_qu(word.lower()))
+    except ValueError:
+        return None
+    dice = assign_dice(chars)
+    if dice is None:
+        return None
+    size = math.isqrt(len(dice_faces))
+    cells = snake_path(size)
+    spare = [die for die in range(len(boggle_dice)) if die not in dice]
+    faces = chars + [boggle_dice[die][0].lower() for die in spare]
+    board = [None] * len(cells)
+    for (row, col), face in zip(cells, faces):
+        board[row * size + col] = face
+    return Placement(board, dice, cells[:len(chars)])
 
-    # Start backtracking from the first character of the word
-    return backtrack(0, set())
+
+def boggleable_flags(trie):
+    """Return one byte per word ID of trie: 1 if the word can be spelled with the dice.
+
+    make_trie_dict.py stores the result as trie.boggleable, for lookup().
+    The answer depends only on a word's letters, so anagrams share one check.
+    """
+    fits = {}
+    flags = bytearray(len(trie.word_list))
+    for word_id, word in enumerate(trie.word_list):
+        if word is None:
+            continue
+        key = signature(word)
+        if key not in fits:
+            fits[key] = can_form_word(word)
+        flags[word_id] = fits[key]
+    return bytes(flags)
+
+
+def lookup(word, trie):
+    """Return can_form_word(word), using trie's precomputed flags when it has them.
+
+    Words added to the trie after it was built, and words not in it, are
+    checked directly.
+    """
+    if trie.boggleable:
+        try:
+            word_id = trie.word_id(word.lower())
+        except ValueError:
+            return False
+        if word_id is not None and word_id < len(trie.boggleable):
+            return bool(trie.boggleable[word_id])
+    return can_form_word(word)
 
 
 @click.command()
+@click.option("--profile", type=click.Choice(MODES), default=None,
+              help="Profile CPU time or memory use and print a summary to stderr.")
+@click.option("--profile-out", default="is-boggleable-profile", show_default=True,
+              help="Prefix for the .pstats / .snapshot files written by --profile.")
 @click.argument("word")
-def cli(word):
+def cli(word, profile, profile_out):
     """Check if a word can be formed using the 16 Boggle dice."""
-    click.echo(can_form_word(word))
+    with Profiler(profile, profile_out):
+        result = can_form_word(word)
+    click.echo(result)
 
 
 if __name__ == "__main__":
@@ -1,18 +1,92 @@
 """
 Build a serialized Trie dictionary from a word list file.
 
+Each word is given a stable integer ID (its position in sorted order),
+which compact result encodings use in place of the word itself. Every
+node counts the words below it, and an index from sorted letters to words
+answers anagram queries. Each word is also flagged with whether the
+Boggle dice can spell it, for is_boggleable.lookup.
+
+With --shards, also write a directory of per-first-letter subtries for
+ShardedDictionary, building the shards in parallel.
+
 Must be run from this module (not __main__) to avoid pickle namespace errors on load.
 """
 
+import json
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import click
+
+from helpers import normalize_qu
+from is_boggleable import boggleable_flags
+from sharded_dictionary import MANIFEST, VERSION
 from trie import Trie, TrieNode
 
 
+def build(words):
+    """Return a full dictionary trie of words: IDs, anagram index and boggleable flags."""
+    trie = Trie()
+    trie.insert_words(words)
+    trie.assign_word_ids()
+    trie.build_anagram_index()
+    trie.boggleable = boggleable_flags(trie)
+    return trie
+
+
 def make(words_file, out_file):
-    words = open(words_file).read().split()
+    build(open(words_file).read().split()).save_to_file(out_file)
+
+
+def build_shard(letter, words, out_file):
+    """Write the subtrie of words starting with letter to out_file; return its word count."""
     trie = Trie()
     trie.insert_words(words)
-    trie.save_to_file(out_file)
+    with open(out_file, "wb") as file:
+        pickle.dump(trie.root.children[letter], file, protocol=-1)
+    return len(trie)
+
+
+def make_shards(words_file, out_dir, workers=None):
+    """Split the word list by first letter and build one shard per letter in parallel."""
+    groups = {}
+    for word in open(words_file).read().split():
+        try:
+            first = next(normalize_qu(word))
+        except (ValueError, StopIteration):
+            continue
+        groups.setdefault(first, []).append(word)
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    letters = sorted(groups)
+    files = [f"{letter}.pkl" for letter in letters]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        counts = executor.map(
+            build_shard,
+            letters,
+            [groups[letter] for letter in letters],
+            [out_dir / name for name in files],
+        )
+        shards = {
+            letter: {"file": name, "words": count}
+            for letter, name, count in zip(letters, files, counts)
+        }
+    (out_dir / MANIFEST).write_text(json.dumps({"version": VERSION, "shards": shards}, indent=1))
+
+
+@click.command()
+@click.option("--words", "words_file", default="words.txt")
+@click.option("--out", "out_file", default="trie.pkl")
+@click.option("--shards", "shard_dir", default=None, help="Also write first-letter shards here.")
+def cli(words_file, out_file, shard_dir):
+    """Build trie.pkl (and optionally a shard directory) from a word list."""
+    make(words_file, out_file)
+    if shard_dir:
+        make_shards(words_file, shard_dir)
 
 
 if __name__ == "__main__":
-    make("words.txt", "trie.pkl")
+    cli()
@@ -0,0 +1,86 @@
+"""
+Optional CPU and memory profiling for the command-line tools and servers.
+
+    with Profiler("cpu", "boggle-profile") as profiler:
+        game = Boggle(...)
+        profiler.mark("load")
+        game.find_words()
+
+"cpu" runs cProfile and writes <output>.pstats. "mem" runs tracemalloc
+and writes <output>-<label>.snapshot at each mark (or once at the end if
+nothing was marked). Either way a short top-N summary goes to stderr.
+The files load with pstats.Stats and tracemalloc.Snapshot.load for
+closer comparison.
+"""
+
+import cProfile
+import io
+import pstats
+import tracemalloc
+
+import click
+
+MODES = ("cpu", "mem")
+
+
+class Profiler:
+    """Context manager that profiles its block; mode None profiles nothing."""
+
+    def __init__(self, mode=None, output="boggle-profile", top=10):
+        if mode not in (None, *MODES):
+            raise ValueError(f"Unknown profile mode {mode!r}")
+        self.mode = mode
+        self.output = output
+        self.top = top
+        self.files = []
+        self.profile = None
+        self.last_snapshot = None
+
+    def __enter__(self):
+        if self.mode == "cpu":
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        elif self.mode == "mem":
+            tracemalloc.start()
+        return self
+
+    def mark(self, label):
+        """Record a memory snapshot named label (memory mode only)."""
+        if self.mode != "mem":
+            return
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+        path = f"{self.output}-{label}.snapshot"
+        snapshot.dump(path)
+        self.files.append(path)
+
+        if self.last_snapshot is None:
+            stats = snapshot.statistics("lineno")
+            heading = f"Memory at {label}"
+        else:
+            stats = snapshot.compare_to(self.last_snapshot, "lineno")
+            heading = f"Memory growth up to {label}"
+        total = sum(stat.size for stat in snapshot.statistics("filename"))
+        click.secho(f"{heading} (traced total {total / 2**20:.1f} MiB):", fg="yellow", err=True)
+        for stat in stats[:self.top]:
+            click.echo(f"  {stat}", err=True)
+        self.last_snapshot = snapshot
+
+    def __exit__(self, *exc_info):
+        if self.mode == "cpu":
+            self.profile.disable()
+            path = f"{self.output}.pstats"
+            self.profile.dump_stats(path)
+            self.files.append(path)
+            summary = io.StringIO()
+            pstats.Stats(self.profile, stream=summary).sort_stats("cumulative").print_stats(self.top)
+            click.echo(summary.getvalue(), err=True)
+        elif self.mode == "mem":
+            if not self.files:
+                self.mark("end")
+            tracemalloc.stop()
+        if self.files:
+            click.secho(f"Profile written to {', '.join(self.files)}", fg="yellow", err=True)
+        return False
@@ -0,0 +1,156 @@
+"""
+Compact binary encoding of solver results as dictionary word IDs.
+
+A list of words found on a board is mostly repeated strings. Every word in
+a dictionary built by make_trie_dict has a stable integer ID, so a result
+can be sent as sorted IDs instead, in one of two layouts:
+
+- "array": the gaps between consecutive sorted IDs, as LEB128 varints.
+  Gaps in a typical result fit in two bytes.
+- "bitset": one bit per dictionary word, set if the word was found.
+  Best when a result holds a large share of the dictionary.
+
+Every blob starts with a small header (magic, version, layout, count), so
+decode() can read either layout and reject data it doesn't understand.
+The header also names the dictionary build: its fingerprint (a hash of
+the word list as numbered by make_trie_dict) and how many IDs it had.
+decode_words refuses a blob from a different build, whose IDs would
+silently map to the wrong words.
+"""
+
+import struct
+from collections import namedtuple
+
+MAGIC = b"BGW"
+VERSION = 2
+# magic, version, layout, count (IDs or bits), dictionary size, dictionary fingerprint
+HEADER = struct.Struct("<3sBBIII")
+Header = namedtuple("Header", "layout count words fingerprint")
+ARRAY, BITSET = 0, 1
+LAYOUTS = {"array": ARRAY, "bitset": BITSET}
+
+
+def encode(ids, universe=None, layout="auto", fingerprint=0):
+    """Encode word IDs as bytes.
+
+    universe is the number of words in the dictionary; it is needed for
+    the bitset layout. With layout "auto" the smaller encoding is used.
+    fingerprint identifies the dictionary the IDs come from.
+    """
+    ids = sorted(set(ids))
+    dictionary = (universe or 0, fingerprint)
+    if layout == "auto":
+        array = _encode_array(ids, dictionary)
+        if universe is None or len(array) <= (universe + 7) // 8:
+            return array
+        return _encode_bitset(ids, dictionary)
+    if layout == "array":
+        return _encode_array(ids, dictionary)
+    if layout == "bitset":
+        if universe is None:
+            raise ValueError("The bitset layout needs the dictionary size")
+        return _encode_bitset(ids, dictionary)
+    raise ValueError(f"Unknown layout {layout!r}")
+
+
+def read_header(data):
+    """Return the Header of an encoded blob, checking its magic and version."""
+    if len(data) < HEADER.size:
+        raise ValueError("Not an encoded Boggle result")
+    magic, version, layout, count, words, fingerprint = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not an encoded Boggle result")
+    if version != VERSION:
+        raise ValueError(f"Unsupported result format version {version}")
+    return Header(layout, count, words, fingerprint)
+
+
+def decode(data):
+    """Return the sorted list of word IDs held in an encoded blob."""
+    header = read_header(data)
+    body = memoryview(data)[HEADER.size:]
+    if header.layout == ARRAY:
+        return _decode_array(body, header.count)
+    if header.layout == BITSET:
+        return _decode_bitset(body, header.count)
+    raise ValueError(f"Unknown layout {header.layout}")
+
+
+def encode_words(words, trie, layout="auto"):
+    """Encode words from trie by their IDs.
+
+    Raises ValueError naming the first word that is not in trie or has no ID.
+    """
+    ids = []
+    for word in words:
+        word_id = trie.word_id(word)
+        if word_id is None:
+            raise ValueError(f"{word!r} has no word ID in this dictionary")
+        ids.append(word_id)
+    return encode(ids, len(trie.word_list), layout, trie.fingerprint)
+
+
+def decode_words(data, trie):
+    """Return the words held in an encoded blob, looked up in trie.
+
+    Raises ValueError if the blob was made with a different dictionary
+    build, or with a later version of this one that has more words.
+    """
+    header = read_header(data)
+    if header.fingerprint != trie.fingerprint:
+        raise ValueError(
+            f"Result was encoded with dictionary {header.fingerprint:08x}, not {trie.fingerprint:08x}"
+        )
+    if header.words > len(trie.word_list):
+        raise ValueError(
+            f"Result was encoded with {header.words} word IDs; this dictionary has {len(trie.word_list)}"
+        )
+    return [trie.word_list[word_id] for word_id in decode(data)]
+
+
+def _encode_array(ids, dictionary):
+    out = bytearray(HEADER.pack(MAGIC, VERSION, ARRAY, len(ids), *dictionary))
+    previous = 0
+    for word_id in ids:
+        gap = word_id - previous
+        previous = word_id
+        while gap >= 0x80:
+            out.append(gap & 0x7F | 0x80)
+            gap >>= 7
+        out.append(gap)
+    return bytes(out)
+
+
+def _decode_array(body, count):
+    ids = []
+    word_id = position = 0
+    for _ in range(count):
+        gap = shift = 0
+        while True:
+            byte = body[position]
+            position += 1
+            gap |= (byte & 0x7F) << shift
+            shift += 7
+            if byte < 0x80:
+                break
+        word_id += gap
+        ids.append(word_id)
+    return ids
+
+
+def _encode_bitset(ids, dictionary):
+    universe = dictionary[0]
+    bits = bytearray((universe + 7) // 8)
+    for word_id in ids:
+        bits[word_id >> 3] |= 1 << (word_id & 7)
+    return HEADER.pack(MAGIC, VERSION, BITSET, universe, *dictionary) + bytes(bits)
+
+
+def _decode_bitset(body, universe):
+    return [
+        index * 8 + bit
+        for index, byte in enumerate(body[:(universe + 7) // 8])
+        if byte
+        for bit in range(8)
+        if byte >> bit & 1
+    ]
@@ -0,0 +1,98 @@
+"""
+Host many concurrent Boggle rounds.
+
+A round solves its board once when it starts and keeps the answers as a
+frozenset, so checking a player's word is a single hash lookup. Scoring
+follows the classic rules: a word found by more than one player scores
+nothing for any of them.
+
+Rounds run on a shared clock and are dropped by expire() once they have
+been over for a while. Nothing here locks, so drive a SessionManager from
+one thread or event loop.
+"""
+
+import itertools
+import time
+from collections import namedtuple
+
+from boggle import Boggle
+from helpers import word_score
+
+# status is one of: "accepted", "shared" (another player found it too),
+# "repeat" (this player already submitted it), "invalid" or "closed".
+Submission = namedtuple("Submission", ["word", "status", "points"])
+
+
+class GameRound:
+    """One round: a solved board and the words each player has found."""
+
+    def __init__(self, game, duration=180.0, clock=time.monotonic):
+        self.board = game.board
+        self.size = game.size
+        self.answers = frozenset(game.find_words())
+        self.clock = clock
+        self.ends_at = clock() + duration
+        self.finders = {}  # word -> players who submitted it
+        self.players = {}  # player -> words they submitted, in order
+
+    @property
+    def is_open(self):
+        return self.clock() < self.ends_at
+
+    def submit(self, player, word):
+        """Record a player's word and return a Submission saying how it fared."""
+        word = word.strip().lower()
+        if not self.is_open:
+            return Submission(word, "closed", 0)
+        if word not in self.answers:
+            return Submission(word, "invalid", 0)
+
+        finders = self.finders.setdefault(word, set())
+        if player in finders:
+            return Submission(word, "repeat", 0)
+        finders.add(player)
+        self.players.setdefault(player, []).append(word)
+        if len(finders) > 1:
+            return Submission(word, "shared", 0)
+        return Submission(word, "accepted", word_score(word))
+
+    def scores(self):
+        """Return each player's score, counting only words no one else found."""
+        return {
+            player: sum(word_score(word) for word in words if len(self.finders[word]) == 1)
+            for player, words in self.players.items()
+        }
+
+    def missed(self):
+        """Return the answers no player found."""
+        return self.answers - self.finders.keys()
+
+
+class SessionManager:
+    """Start, look up and expire rounds by id."""
+
+    def __init__(self, duration=180.0, linger=60.0, clock=time.monotonic):
+        self.duration = duration
+        self.linger = linger  # how long a finished round stays available for results
+        self.clock = clock
+        self.rounds = {}
+        self.ids = itertools.count(1)
+
+    def start_round(self, letters=None, size=4):
+        """Solve a new board (random if no letters are given) and return its round id."""
+        game = Boggle(size=size, letters=letters)
+        round_id = next(self.ids)
+        self.rounds[round_id] = GameRound(game, self.duration, self.clock)
+        return round_id
+
+    def submit(self, round_id, player, word):
+        """Submit a word to a round. Raises KeyError for unknown or expired rounds."""
+        return self.rounds[round_id].submit(player, word)
+
+    def expire(self):
+        """Drop rounds that ended more than linger seconds ago; return how many."""
+        cutoff = self.clock() - self.linger
+        finished = [rid for rid, game_round in self.rounds.items() if game_round.ends_at < cutoff]
+        for round_id in finished:
+            del self.rounds[round_id]
+        return len(finished)
@@ -10,7 +10,8 @@ setup(
     name='Boggle',
     author='Kevin Brown',
     version='0.1.1',
-    py_modules=['boggle', 'trie', 'helpers', 'is_boggleable'],
+    py_modules=['boggle', 'trie', 'helpers', 'is_boggleable', 'batch', 'boggle_http', 'session', 'result_codec', 'hot_reload',
+                'sharded_dictionary', 'boggle_stats', 'profiling', 'make_trie_dict'],
     data_files=[
         (rel_purelib, ['trie.pkl']),
     ],
@@ -21,6 +22,8 @@ setup(
         'console_scripts': [
             'boggle = boggle:cli',
             'is-boggleable = is_boggleable:cli',
+            'boggle-http = boggle_http:cli',
+            'boggle-stats = boggle_stats:cli',
         ],
     },
 )
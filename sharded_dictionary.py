@@ -0,0 +1,61 @@
+"""
+A dictionary split into one file per first letter, loaded on demand.
+
+A 4x4 board shows at most 16 distinct letters, and only words starting
+with one of them can be found. make_trie_dict.py --shards writes a
+directory holding one pickled subtrie per first letter ('qu' included)
+and a manifest. ShardedDictionary.for_letters then assembles a trie from
+just the shards a board needs, keeping recently used shards in a bounded
+cache. That makes a cold start cheaper for short-lived processes.
+"""
+
+import json
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from trie import Trie
+
+MANIFEST = "manifest.json"
+VERSION = 1
+
+
+class ShardedDictionary:
+    """Load first-letter shards of a dictionary as boards need them."""
+
+    def __init__(self, directory=None, cache_size=16):
+        if directory is None:
+            directory = Path(__file__).parent / "trie_shards"
+        self.directory = Path(directory)
+        manifest = json.loads((self.directory / MANIFEST).read_text())
+        if manifest["version"] != VERSION:
+            raise ValueError(f"Unsupported shard format version {manifest['version']}")
+        self.shards = manifest["shards"]
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+
+    def load_shard(self, letter):
+        """Return the subtrie for words starting with letter, using the cache."""
+        with self.lock:
+            if letter in self.cache:
+                self.cache.move_to_end(letter)
+                return self.cache[letter]
+        with open(self.directory / self.shards[letter]["file"], "rb") as file:
+            node = pickle.load(file)
+        with self.lock:
+            self.cache[letter] = node
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return node
+
+    def for_letters(self, letters):
+        """Return a frozen Trie holding only the words that start with one of letters."""
+        trie = Trie()
+        for letter in sorted(set(letters) & self.shards.keys()):
+            node = self.load_shard(letter)
+            trie.root.children[letter] = node
+            trie.root.count += node.count
+            trie.word_count += self.shards[letter]["words"]
+        return trie.freeze()
@@ -0,0 +1,64 @@
+import pytest
+
+from batch import find_words_batch, neighbor_table, solve_boards
+from boggle import Boggle
+from trie import Trie
+
+
+# --- neighbor_table ---
+
+def test_neighbor_table_corner_and_center():
+    table = neighbor_table(3)
+    assert sorted(table[0]) == [1, 3, 4]
+    assert sorted(table[4]) == [0, 1, 2, 3, 5, 6, 7, 8]
+
+
+# --- find_words_batch ---
+
+@pytest.fixture(scope="module")
+def games():
+    letters = ["lntoeprostienesi", "toessinelreixdly", "abcdefghijklmnop"]
+    boards = [Boggle(letters=board) for board in letters]
+    boards.append(Boggle(size=5, letters="quietsarenotalwaysloudhere"))
+    return boards
+
+
+def test_batch_matches_find_words(games):
+    assert find_words_batch(games) == [game.find_words() for game in games]
+
+
+def test_batch_empty():
+    assert find_words_batch([]) == []
+
+
+def test_batch_with_custom_dictionary():
+    dictionary = Trie()
+    dictionary.insert_words(["abe", "fab", "bad", "cab"])
+    games = [Boggle(size=2, letters="abef"), Boggle(size=2, letters="cabd")]
+    for game in games:
+        game.dictionary = dictionary
+    assert find_words_batch(games, dictionary) == [{"abe", "fab"}, {"cab", "bad"}]
+
+
+def test_batch_does_not_reuse_cells():
+    dictionary = Trie()
+    dictionary.insert_words(["aaa", "aaaa", "aaaaa"])
+    game = Boggle(size=2, letters="aaaa")
+    assert find_words_batch([game], dictionary) == [{"aaa", "aaaa"}]
+
+
+# --- solve_boards ---
+
+@pytest.mark.parametrize("pool", ["thread", "process"])
+def test_solve_boards_matches_find_words(pool):
+    letters = ["lntoeprostienesi", "toessinelreixdly", "abcdefghijklmnop"]
+    expected = [Boggle(letters=board).find_words() for board in letters]
+    assert solve_boards(letters, workers=2, pool=pool, chunk_size=2) == expected
+
+
+def test_solve_boards_encoded():
+    import result_codec
+    letters = ["lntoeprostienesi", "toessinelreixdly"]
+    blobs = solve_boards(letters, encoded=True)
+    decoded = [set(result_codec.decode_words(blob, Boggle.dictionary)) for blob in blobs]
+    assert decoded == [Boggle(letters=board).find_words() for board in letters]
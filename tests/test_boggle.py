@@ -1,5 +1,6 @@
 import pytest
-from boggle import Boggle, boggle_dice
+from boggle import Boggle, RANKINGS, boggle_dice
+from trie import Trie
 
 
 # --- Boggle.__init__ ---
@@ -82,14 +83,27 @@ def test_form_board_creates_square_matrix():
     ]
 
 
-# --- Boggle.visited ---
+# --- reentrancy ---
 
 
-def test_visited_board_initialized_to_false():
+def test_find_words_keeps_no_scratch_state():
     game = Boggle(letters="abcdefghijklmnop")
-    for row in game.visited:
-        for cell in row:
-            assert cell is False
+    assert not hasattr(game, "visited")
+
+
+def test_find_words_from_many_threads():
+    from concurrent.futures import ThreadPoolExecutor
+    game = Boggle(letters="lntoeprostienesi")
+    expected = game.find_words()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: game.find_words(strategy="board"), range(32)))
+    assert all(result == expected for result in results)
+
+
+def test_shared_dictionary_is_loaded_once_and_frozen():
+    Boggle(letters="abcdefghijklmnop")
+    assert Boggle.load_shared_dictionary() is Boggle.dictionary
+    assert Boggle.dictionary.frozen
 
 
 # --- Boggle.find_words ---
@@ -170,3 +184,180 @@ def test_random_letters_come_from_cubes():
         assert letter in all_faces
 
 
+# --- Boggle.top_words ---
+
+
+@pytest.mark.parametrize("key", ["length", "score"])
+@pytest.mark.parametrize("k", [1, 5, 25])
+def test_top_words_matches_sorted_find_words(key, k):
+    game = Boggle(letters="lntoeprostienesi")
+    rank = RANKINGS[key]
+    expected = sorted(game.find_words(), key=lambda w: (-rank(len(w)), w))[:k]
+    assert game.top_words(k, key=key) == expected
+
+
+def test_top_words_k_larger_than_word_count():
+    game = Boggle(letters="toessinelreixdly")
+    assert sorted(game.top_words(10_000)) == sorted(game.find_words())
+
+
+def test_top_words_zero_returns_empty():
+    game = Boggle(letters="toessinelreixdly")
+    assert game.top_words(0) == []
+
+
+def test_top_words_is_repeatable():
+    game = Boggle(letters="toessinelreixdly")
+    assert game.top_words(3) == game.top_words(3)
+
+
+# --- Boggle.find_path / contains_word ---
+
+
+def test_find_path_returns_adjacent_cells():
+    game = Boggle(letters="toessinelreixdly")
+    path = game.find_path("rein")
+    assert "".join(game.board[x][y] for x, y in path) == "rein"
+    assert len(set(path)) == len(path)
+    for (x1, y1), (x2, y2) in zip(path, path[1:]):
+        assert max(abs(x1 - x2), abs(y1 - y2)) == 1
+
+
+def test_find_path_missing_word():
+    game = Boggle(letters="abcdefghijklmnop")
+    assert game.find_path("pa") is None  # letters present but not adjacent
+    assert game.find_path("zoo") is None  # letter not on board
+
+
+def test_find_path_does_not_reuse_cells():
+    game = Boggle(size=2, letters="abcd")
+    assert game.find_path("aba") is None
+
+
+def test_find_path_handles_qu():
+    game = Boggle(letters="quietabcdefghijkl")
+    assert game.find_path("QUIET") == [(0, 0), (0, 1), (0, 2), (0, 3)]
+    assert game.find_path("qi") is None
+
+
+def test_contains_word_agrees_with_find_words():
+    game = Boggle(letters="lntoeprostienesi")
+    found = game.find_words()
+    for word in found:
+        assert game.contains_word(word)
+    for word in ["lento", "pro", "tie", "zebra", "ne", "trip"]:
+        assert game.contains_word(word) == (word in found)
+
+
+# --- strategies ---
+
+
+@pytest.mark.parametrize("letters", ["lntoeprostienesi", "toessinelreixdly", "quietabcdefghijkl"])
+def test_strategies_find_the_same_words(letters):
+    game = Boggle(letters=letters)
+    assert game.find_words(strategy="dictionary") == game.find_words(strategy="board")
+
+
+def test_unknown_strategy_raises():
+    game = Boggle(letters="abcdefghijklmnop")
+    with pytest.raises(ValueError, match="Unknown strategy"):
+        game.find_words(strategy="sideways")
+
+
+def test_plan_prefers_board_for_full_dictionary():
+    game = Boggle(letters="lntoeprostienesi")
+    assert game.plan_strategy() == "board"
+
+
+def test_plan_prefers_dictionary_when_few_words_are_spellable():
+    from itertools import product
+    from trie import Trie
+    game = Boggle(size=2, letters="zzzz")
+    game.dictionary = Trie()
+    game.dictionary.insert_words("".join(p) for p in product("abcde", repeat=4))
+    assert game.plan_strategy() == "dictionary"
+    assert game.find_words() == set()
+
+
+def test_to_dict_records_strategy():
+    game = Boggle(letters="lntoeprostienesi")
+    result = game.to_dict(strategy="dictionary")
+    assert result["strategy"] == "dictionary"
+    assert result["count"] == len(game.find_words())
+    assert Boggle(letters="lntoeprostienesi").to_dict()["strategy"] == "board"
+
+
+# --- word IDs ---
+
+
+def test_to_bytes_round_trips_found_words():
+    import result_codec
+    game = Boggle(letters="lntoeprostienesi")
+    blob = game.to_bytes()
+    assert set(result_codec.decode_words(blob, game.dictionary)) == game.find_words()
+    assert result_codec.decode(blob) == game.find_word_ids()
+
+
+def test_find_word_ids_needs_built_ids():
+    from trie import Trie
+    game = Boggle(size=2, letters="abcd")
+    game.dictionary = Trie()
+    game.dictionary.insert("cab")
+    with pytest.raises(ValueError, match="no word IDs"):
+        game.find_word_ids()
+
+
+# --- Boggle.find_words_within ---
+
+
+def test_find_words_within_without_budgets_matches_find_words():
+    game = Boggle(letters="lntoeprostienesi")
+    result = game.find_words_within()
+    assert result.words == game.find_words()
+    assert result.truncated is False
+    assert result.state is None
+    assert result.stats["pending"] == 0
+
+
+def test_node_budget_truncates_and_resumes():
+    game = Boggle(letters="lntoeprostienesi")
+    result = game.find_words_within(node_budget=200)
+    assert result.truncated is True
+    assert result.stats["nodes"] == 200
+    assert result.words < game.find_words()
+    parts = 1
+    while result.truncated:
+        result = game.find_words_within(node_budget=200, resume=result.state)
+        parts += 1
+    assert parts > 2
+    assert result.words == game.find_words()
+
+
+def test_max_results_budget():
+    game = Boggle(letters="lntoeprostienesi")
+    result = game.find_words_within(max_results=10)
+    assert result.truncated is True
+    assert len(result.words) == 10
+    rest = game.find_words_within(resume=result.state)
+    assert rest.words == game.find_words()
+
+
+def test_time_budget():
+    game = Boggle(size=12)
+    result = game.find_words_within(time_budget=0)
+    assert result.truncated is True
+    assert result.stats["nodes"] == 0
+
+
+def test_saved_state_is_plain_data():
+    import json
+    game = Boggle(letters="lntoeprostienesi")
+    state = game.find_words_within(node_budget=100).state
+    restored = json.loads(json.dumps(state))
+    assert game.find_words_within(resume=restored).words == game.find_words()
+
+
+def test_empty_dictionary_is_kept():
+    game = Boggle(size=2, letters="abcd", dictionary=Trie())
+    assert len(game.dictionary) == 0
+    assert game.find_words() == set()
@@ -1,6 +1,6 @@
 import pytest
 
-from helpers import normalize_qu
+from helpers import normalize_qu, word_score
 
 
 def test_plain_word():
@@ -41,3 +41,19 @@ def test_single_non_q_character():
 
 def test_just_qu():
     assert list(normalize_qu("qu")) == ["qu"]
+
+
+# --- word_score ---
+
+@pytest.mark.parametrize("word, points", [
+    ("at", 0),
+    ("cat", 1),
+    ("cats", 1),
+    ("quiet", 2),
+    ("street", 3),
+    ("streets", 5),
+    ("triplets", 11),
+    ("sentimentality", 11),
+])
+def test_word_score(word, points):
+    assert word_score(word) == points
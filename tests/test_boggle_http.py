@@ -0,0 +1,278 @@
+import asyncio
+import json
+import os
+
+import pytest
+
+from boggle import Boggle
+from boggle_http import BoggleServer, MicroBatcher, percentile, solve_requests
+
+
+# --- helpers ---
+
+async def request(reader, writer, method, path, payload=None, raw=None):
+    body = raw if raw is not None else (json.dumps(payload).encode() if payload else b"")
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    status_line, *headers = head.decode().split("\r\n")
+    length = next(int(h.split(":")[1]) for h in headers if h.lower().startswith("content-length"))
+    return int(status_line.split()[1]), json.loads(await reader.readexactly(length))
+
+
+def run_with_server(scenario, **options):
+    """Start a thread-pool server on a free port, run scenario(host, port), then stop."""
+
+    async def main():
+        server = BoggleServer(pool="thread", workers=2, **options)
+        host, port = await server.start("127.0.0.1", 0)
+        try:
+            return await scenario(server, host, port)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+# --- percentile ---
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 0.5) == 51
+    assert percentile(values, 0.99) == 100
+    assert percentile([], 0.5) == 0.0
+
+
+# --- solve_requests ---
+
+def test_solve_requests_matches_find_words_and_reports_errors():
+    results = solve_requests([("lntoeprostienesi", 4), ("abc", 4)])
+    assert set(results[0]["words"]) == Boggle(letters="lntoeprostienesi").find_words()
+    assert results[0]["count"] == len(results[0]["words"])
+    assert "cannot be formatted" in results[1]["error"]
+
+
+# --- endpoints ---
+
+def test_endpoints_on_one_keep_alive_connection():
+    async def scenario(server, host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        solved = await request(reader, writer, "POST", "/solve", {"letters": "lntoeprostienesi"})
+        valid = await request(
+            reader, writer, "POST", "/validate", {"letters": "lntoeprostienesi", "word": "lento"}
+        )
+        invalid = await request(
+            reader, writer, "POST", "/validate", {"letters": "lntoeprostienesi", "word": "zebra"}
+        )
+        boggleable = await request(reader, writer, "POST", "/is-boggleable", {"word": "sweater"})
+        metrics = await request(reader, writer, "GET", "/metrics")
+        writer.close()
+        return solved, valid, invalid, boggleable, metrics
+
+    solved, valid, invalid, boggleable, metrics = run_with_server(scenario)
+    assert solved[0] == 200
+    assert set(solved[1]["words"]) == Boggle(letters="lntoeprostienesi").find_words()
+    assert valid == (200, {"word": "lento", "valid": True, "path": valid[1]["path"], "score": 2})
+    assert len(valid[1]["path"]) == 5
+    assert invalid[1]["valid"] is False
+    assert boggleable == (200, {"word": "sweater", "boggleable": True})
+    assert metrics[0] == 200
+    assert metrics[1]["requests"] == 4
+    assert metrics[1]["queue_depth"] == 0
+    assert metrics[1]["latency_ms"]["p99"] >= metrics[1]["latency_ms"]["p50"] > 0
+
+
+@pytest.mark.parametrize("method, path, raw, status", [
+    ("GET", "/nowhere", b"", 404),
+    ("GET", "/solve", b"", 405),
+    ("POST", "/solve", b"{not json", 400),
+    ("POST", "/solve", b'{"letters": "abc"}', 400),
+    ("POST", "/validate", b'{"letters": "lntoeprostienesi"}', 400),
+    ("POST", "/solve", b'{"size": 40}', 400),
+    ("POST", "/validate", b'{"letters": "a", "size": 1, "word": "a"}', 400),
+])
+def test_error_responses(method, path, raw, status):
+    async def scenario(server, host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        result = await request(reader, writer, method, path, raw=raw)
+        writer.close()
+        return result
+
+    result_status, payload = run_with_server(scenario)
+    assert result_status == status
+    assert "error" in payload
+
+
+def test_concurrent_solves_share_micro_batches():
+    boards = ["lntoeprostienesi", "toessinelreixdly", "abcdefghijklmnop"] * 4
+
+    async def scenario(server, host, port):
+        async def solve(letters):
+            reader, writer = await asyncio.open_connection(host, port)
+            result = await request(reader, writer, "POST", "/solve", {"letters": letters})
+            writer.close()
+            return result
+
+        results = await asyncio.gather(*(solve(letters) for letters in boards))
+        return results, server.batcher.batches
+
+    results, batches = run_with_server(scenario, window=0.05)
+    assert all(status == 200 for status, _ in results)
+    assert batches < len(boards)
+
+
+# --- MicroBatcher ---
+
+def test_batcher_flushes_when_full():
+    from concurrent.futures import ThreadPoolExecutor
+
+    async def main():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            batcher = MicroBatcher(executor, window=60, max_batch=2)
+            first = batcher.submit("lntoeprostienesi", 4)
+            second = batcher.submit("abc", 4)
+            return await asyncio.wait_for(asyncio.gather(first, second), timeout=10), batcher
+
+    (first, second), batcher = asyncio.run(main())
+    assert first["count"] > 0
+    assert "error" in second
+    assert batcher.batches == 1
+
+
+def test_bad_request_does_not_fail_its_batch():
+    async def scenario(server, host, port):
+        async def solve(payload):
+            reader, writer = await asyncio.open_connection(host, port)
+            result = await request(reader, writer, "POST", "/solve", payload)
+            writer.close()
+            return result
+
+        return await asyncio.gather(solve({"letters": "lntoeprostienesi"}), solve({"letters": 123}))
+
+    (good_status, good), (bad_status, bad) = run_with_server(scenario, window=0.05)
+    assert good_status == 200 and good["count"] > 0
+    assert bad_status == 400 and "error" in bad
+
+
+def test_solve_requests_isolates_unexpected_errors():
+    results = solve_requests([("lntoeprostienesi", 4), (["a", 1], 4)])
+    assert results[0]["count"] > 0
+    assert "TypeError" in results[1]["error"]
+
+
+@pytest.mark.parametrize("path, raw", [
+    ("/is-boggleable", b'{"word": 5}'),
+    ("/is-boggleable", b'["sweater"]'),
+    ("/solve", b'{"letters": "lntoeprostienesi", "size": "big"}'),
+    ("/validate", b'{"letters": "lntoeprostienesi", "word": null}'),
+])
+def test_wrongly_typed_bodies_get_400(path, raw):
+    async def scenario(server, host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        result = await request(reader, writer, "POST", path, raw=raw)
+        writer.close()
+        return result
+
+    status, payload = run_with_server(scenario)
+    assert status == 400
+    assert "error" in payload
+
+
+@pytest.mark.parametrize("head, status", [
+    (b"NONSENSE\r\n\r\n", 400),
+    (b"POST /solve HTTP/1.1\r\nContent-Length: lots\r\n\r\n", 400),
+    (b"POST /solve HTTP/1.1\r\nContent-Length: 100000000\r\n\r\n", 413),
+    (b"GET /metrics HTTP/1.1\r\nX-Padding: " + b"a" * 70_000 + b"\r\n\r\n", 431),
+])
+def test_malformed_requests_get_an_error_and_close(head, status):
+    async def scenario(server, host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(head)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        return response
+
+    response = run_with_server(scenario)
+    assert response.startswith(f"HTTP/1.1 {status} ".encode())
+    assert b"Connection: close" in response
+
+
+def test_truncated_body_closes_quietly():
+    async def scenario(server, host, port):
+        loop_errors = []
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: loop_errors.append(context))
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(b"POST /solve HTTP/1.1\r\nContent-Length: 50\r\n\r\n{}")
+        writer.write_eof()
+        response = await reader.read()
+        writer.close()
+        await asyncio.sleep(0.05)
+        # The server is still healthy afterwards.
+        reader, writer = await asyncio.open_connection(host, port)
+        status, _ = await request(reader, writer, "GET", "/metrics")
+        writer.close()
+        return response, status, list(loop_errors)
+
+    response, status, loop_errors = run_with_server(scenario)
+    assert response == b""
+    assert status == 200
+    assert loop_errors == []
+
+
+def test_process_pool_is_warm_after_start(tmp_path):
+    words = tmp_path / "words.txt"
+    words.write_text("lent\nlento\npro\n")
+
+    async def main():
+        server = BoggleServer(pool="process", workers=2, dictionary=str(words))
+        try:
+            await server.start("127.0.0.1", 0)
+            return await server.warm(server.executor)
+        finally:
+            await server.close()
+
+    assert len(asyncio.run(main())) == 2
+
+
+def test_process_pool_reload_swaps_in_a_warm_pool(tmp_path):
+    old_words, new_words = tmp_path / "old.txt", tmp_path / "new.txt"
+    old_words.write_text("lent\n")
+    new_words.write_text("lento\n")
+
+    async def main():
+        server = BoggleServer(pool="process", workers=2, dictionary=str(old_words))
+        try:
+            await server.start("127.0.0.1", 0)
+            before = await server.batcher.submit("lntoeprostienesi", 4)
+            seconds = await server.reload(str(new_words))
+            after = await server.batcher.submit("lntoeprostienesi", 4)
+            return before, seconds, after
+        finally:
+            await server.close()
+
+    before, seconds, after = asyncio.run(main())
+    assert before["words"] == ["lent"]
+    assert after["words"] == ["lento"]
+    assert seconds > 0
+
+
+def test_process_pool_gets_word_list_built_once(tmp_path):
+    words = tmp_path / "words.txt"
+    words.write_text("lent\n")
+
+    async def main():
+        server = BoggleServer(pool="process", workers=2, dictionary=str(words))
+        scratch = list(server.scratch)
+        try:
+            await server.start("127.0.0.1", 0)
+            return scratch, server.scratch
+        finally:
+            await server.close()
+
+    scratch, remaining = asyncio.run(main())
+    assert len(scratch) == 1 and scratch[0].endswith(".pkl")
+    assert remaining == []
+    assert not any(map(os.path.exists, scratch))
@@ -0,0 +1,131 @@
+import pytest
+from click.testing import CliRunner
+
+from boggle import Boggle
+from boggle_stats import WordStats, cli, load_checkpoint, load_dice, run_chunk, simulate
+from helpers import boggle_dice, pre1987_boggle_dice
+
+
+# --- load_dice ---
+
+def test_named_dice_sets():
+    assert load_dice("modern") is boggle_dice
+    assert load_dice("pre1987") is pre1987_boggle_dice
+
+
+def test_dice_from_file(tmp_path):
+    path = tmp_path / "dice.txt"
+    path.write_text("AEANEG\n\nn u i h m qu\n")
+    assert load_dice(path) == ["aeaneg", ("n", "u", "i", "h", "m", "qu")]
+
+
+def test_boggle_rolls_custom_dice():
+    game = Boggle(size=2, dice=["aaaaaa", "bbbbbb", "cccccc", "dddddd"])
+    assert sorted(ch for row in game.board for ch in row) == ["a", "b", "c", "d"]
+
+
+# --- WordStats ---
+
+def test_word_stats_counts():
+    stats = WordStats()
+    stats.add({"tea", "eat"})
+    stats.add({"tea", "teas", "seated"})
+    assert stats.boards == 2
+    assert stats.probability("tea") == 1.0
+    assert stats.probability("seated") == 0.5
+    assert stats.probability("zebra") == 0.0
+    assert stats.word_counts == {2: 1, 3: 1}
+    assert stats.scores == {2: 1, 5: 1}
+    assert stats.most_common(1) == [("tea", 1.0)]
+
+
+def test_word_stats_merge_and_round_trip():
+    first, second = WordStats(), WordStats()
+    first.seeds, second.seeds = {1}, {2}
+    first.add({"tea"})
+    second.add({"tea", "eat"})
+    merged = WordStats.from_dict(first.to_dict()).merge(second)
+    assert merged.boards == 2
+    assert merged.seeds == {1, 2}
+    assert merged.word_boards == {"tea": 2, "eat": 1}
+    assert merged.word_counts == {1: 1, 2: 1}
+
+
+def test_merge_refuses_runs_with_the_same_seed():
+    first, second = WordStats(), WordStats()
+    first.seeds, second.seeds = {1, 2}, {2}
+    with pytest.raises(ValueError, match="seed 2"):
+        first.merge(second)
+
+
+def test_summary():
+    summary = WordStats.summary({10: 1, 20: 1})
+    assert summary == {"mean": 15.0, "stdev": 5.0, "min": 10, "max": 20}
+    assert WordStats.summary({})["mean"] == 0.0
+
+
+# --- runs ---
+
+def test_run_chunk_is_reproducible():
+    first = run_chunk(5, 4, boggle_dice, seed=3)
+    second = run_chunk(5, 4, boggle_dice, seed=3)
+    assert first.to_dict() == second.to_dict()
+    assert first.boards == 5
+
+
+def test_neighboring_seeds_roll_different_chunks():
+    # With seed + chunk, seed 0 chunk 1 and seed 1 chunk 0 would be the same boards.
+    assert run_chunk(5, 4, boggle_dice, 0, 1).to_dict() != run_chunk(5, 4, boggle_dice, 1, 0).to_dict()
+
+
+def test_simulate_without_seed_picks_and_records_one():
+    first = simulate(boards=2, chunk_size=2, workers=1)
+    second = simulate(boards=2, chunk_size=2, workers=1)
+    assert len(first.seeds) == 1 and first.seeds != second.seeds
+    assert first.merge(second).boards == 4
+
+
+def test_simulate_resumes_from_checkpoint(tmp_path):
+    checkpoint = tmp_path / "run.json"
+    settings = dict(boards=6, chunk_size=2, seed=1, workers=1)
+    expected = simulate(**settings).to_dict()
+
+    def interrupt(stats):
+        raise RuntimeError("stop")
+
+    with pytest.raises(RuntimeError):
+        simulate(checkpoint=checkpoint, on_chunk=interrupt, **settings)
+    partial, _, next_chunk = load_checkpoint(checkpoint)
+    assert (partial.boards, next_chunk) == (2, 1)
+
+    resumed = simulate(checkpoint=checkpoint, **settings)
+    assert resumed.to_dict() == expected
+
+
+def test_simulate_rejects_checkpoint_from_other_settings(tmp_path):
+    checkpoint = tmp_path / "run.json"
+    simulate(boards=2, chunk_size=2, workers=1, seed=1, checkpoint=checkpoint)
+    with pytest.raises(ValueError, match=r"different settings \(seed\)"):
+        simulate(boards=2, chunk_size=2, workers=1, seed=9, checkpoint=checkpoint)
+
+
+# --- cli ---
+
+def test_cli_reports_mismatched_checkpoint_as_usage_error(tmp_path):
+    checkpoint = str(tmp_path / "run.json")
+    options = ["--boards", "2", "--chunk-size", "2", "--workers", "1", "--checkpoint", checkpoint]
+    assert CliRunner().invoke(cli, options + ["--seed", "1"]).exit_code == 0
+    result = CliRunner().invoke(cli, options + ["--seed", "9"])
+    assert result.exit_code == 2
+    assert "different settings (seed)" in result.output
+    assert "Traceback" not in result.output
+
+
+def test_cli_reports_overlapping_merge_as_bad_parameter(tmp_path):
+    checkpoint = str(tmp_path / "run.json")
+    CliRunner().invoke(cli, ["--boards", "2", "--chunk-size", "2", "--workers", "1", "--seed", "1",
+                             "--checkpoint", checkpoint])
+    result = CliRunner().invoke(cli, ["--merge", checkpoint, "--merge", checkpoint])
+    assert result.exit_code == 2
+    assert "Invalid value for --merge" in result.output
+    assert "seed 1" in result.output
@@ -0,0 +1,134 @@
+import os
+import signal
+import threading
+
+import pytest
+
+from boggle import Boggle
+from hot_reload import (
+    DictionaryWatcher, apply_changes, load_dictionary, reload_dictionary, reload_on_signal,
+)
+from trie import Trie
+
+
+@pytest.fixture
+def restore_dictionary():
+    original = Boggle.load_shared_dictionary()
+    yield
+    Boggle.swap_dictionary(original)
+
+
+@pytest.fixture
+def word_file(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("cab\nabe\nfab\n")
+    return path
+
+
+def test_load_dictionary_from_word_list(word_file):
+    trie = load_dictionary(word_file)
+    assert trie.frozen
+    assert trie.word_list == ["abe", "cab", "fab"]
+    assert trie.anagrams("bac") == ["cab"]
+    assert trie.boggleable == bytes([1, 1, 1])
+
+
+def test_load_dictionary_from_pickle(tmp_path):
+    trie = Trie()
+    trie.insert_words(["cab", "abe"])
+    trie.save_to_file(tmp_path / "trie.pkl")
+    assert sorted(load_dictionary(tmp_path / "trie.pkl").words()) == ["abe", "cab"]
+
+
+def test_reload_affects_only_new_boards(restore_dictionary, word_file):
+    before = Boggle(size=2, letters="cabe")
+    seconds = reload_dictionary(word_file)
+    after = Boggle(size=2, letters="cabe")
+    assert seconds >= 0
+    assert after.find_words() == {"cab", "abe"}
+    assert "bac" not in after.find_words()
+    assert before.dictionary is not after.dictionary
+    assert "bec" not in before.find_words()
+    assert len(before.dictionary) > 1000
+
+
+def test_apply_changes_adds_and_bans_words(restore_dictionary):
+    apply_changes(added=["lntoe"], removed=["lento"])
+    game = Boggle(letters="lntoeprostienesi")
+    words = game.find_words()
+    assert "lntoe" in words
+    assert "lento" not in words
+    assert Boggle.dictionary.frozen
+
+
+def test_watcher_reloads_on_change(restore_dictionary, word_file):
+    reloaded = []
+    watcher = DictionaryWatcher(word_file, on_reload=lambda path, seconds: reloaded.append(path))
+    assert watcher.check() is False
+    word_file.write_text("ace\n")
+    os.utime(word_file, ns=(0, watcher.last_modified[0] + 1))
+    assert watcher.check() is False  # waits one interval for the file to settle
+    assert watcher.check() is True
+    assert reloaded == [word_file]
+    assert list(Boggle.dictionary.words()) == ["ace"]
+
+
+def test_watcher_waits_while_file_is_being_written(restore_dictionary, word_file):
+    watcher = DictionaryWatcher(word_file, on_reload=lambda path, seconds: None)
+    word_file.write_text("ace\n")
+    assert watcher.check() is False
+    with word_file.open("a") as partial:
+        partial.write("bad\n")
+    assert watcher.check() is False
+    assert watcher.check() is True
+    assert list(Boggle.dictionary.words()) == ["ace", "bad"]
+
+
+def test_watcher_reports_failed_reload_and_retries(restore_dictionary, word_file):
+    errors = []
+    attempts = []
+
+    def flaky_reload(path):
+        attempts.append(path)
+        if len(attempts) == 1:
+            raise ValueError("half-written file")
+        return reload_dictionary(path)
+
+    watcher = DictionaryWatcher(
+        word_file, reload=flaky_reload, on_reload=lambda path, seconds: None,
+        on_error=lambda path, error: errors.append(str(error)),
+    )
+    before = watcher.last_modified
+    word_file.write_text("ace\n")
+    watcher.check()
+    assert watcher.check() is False
+    assert errors == ["half-written file"]
+    assert watcher.last_modified == before
+    assert watcher.check() is True
+    assert list(Boggle.dictionary.words()) == ["ace"]
+
+
+def test_reload_on_signal_defaults_to_sighup(restore_dictionary, word_file, monkeypatch):
+    installed = {}
+    monkeypatch.setattr(signal, "signal", lambda signum, handler: installed.update({signum: handler}))
+    if hasattr(signal, "SIGHUP"):
+        reload_on_signal(word_file)
+        assert list(installed) == [signal.SIGHUP]
+    monkeypatch.delattr(signal, "SIGHUP", raising=False)
+    with pytest.raises(ValueError, match="SIGHUP"):
+        reload_on_signal(word_file)
+    reload_on_signal(word_file, signum=signal.SIGINT)
+    assert signal.SIGINT in installed
+
+
+def test_solves_in_flight_during_swap(restore_dictionary, word_file):
+    game = Boggle(letters="lntoeprostienesi")
+    expected = game.find_words()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(game.find_words())) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    reload_dictionary(word_file)
+    for thread in threads:
+        thread.join()
+    assert results == [expected] * 4
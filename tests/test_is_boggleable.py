@@ -1,6 +1,10 @@
 import pytest
 
-from is_boggleable import can_form_word, boggle_dice, dice_faces
+from boggle import Boggle
+from is_boggleable import (
+    assign_dice, boggle_dice, boggleable_flags, can_form_word, dice_faces, lookup, place_word, snake_path,
+)
+from trie import Trie
 
 
 # --- Module-level constants ---
@@ -137,3 +141,53 @@ def test_qu_frees_u_die_for_other_letters():
     # and the 'u' on the Qu die itself are still available for other letters.
     # "quorum" = qu(Qu die) + o + r + u(separate die) + m
     assert can_form_word("quorum") is True
+
+
+# --- Exact placement and bulk flags ---
+
+def test_snake_path_visits_every_cell_through_neighbors():
+    path = snake_path(4)
+    assert sorted(path) == [(row, col) for row in range(4) for col in range(4)]
+    for (r1, c1), (r2, c2) in zip(path, path[1:]):
+        assert max(abs(r1 - r2), abs(c1 - c2)) == 1
+
+
+def test_assign_dice_uses_distinct_dice_showing_each_letter():
+    chars = ["qu", "i", "n", "t", "e", "s", "s", "e", "n", "t", "i", "a", "l"]
+    dice = assign_dice(chars)
+    assert len(set(dice)) == len(chars)
+    assert all(char in dice_faces[die] for char, die in zip(chars, dice))
+
+
+@pytest.mark.parametrize("word", ["quintessential", "sweater", "imperceptibility"])
+def test_place_word_gives_a_board_that_spells_the_word(word):
+    placement = place_word(word)
+    assert sorted(placement.dice) == sorted(set(placement.dice))
+    game = Boggle(letters="".join(placement.board), dictionary=Trie())
+    assert game.find_path(word) is not None
+    for (row, col), die in zip(placement.path, placement.dice):
+        assert placement.board[row * 4 + col] in dice_faces[die]
+
+
+@pytest.mark.parametrize("word", ["bookkeeper", "acetylcholinesterase", "qat"])
+def test_place_word_rejects_unformable_words(word):
+    assert place_word(word) is None
+
+
+def test_long_words_fail_fast():
+    # Longer than 16 dice: rejected without searching.
+    assert can_form_word("adrenocorticotrophins") is False
+
+
+def test_bulk_flags_and_lookup():
+    trie = Trie()
+    trie.insert_words(["quiet", "quite", "bookkeeper", "fork"])
+    trie.assign_word_ids()
+    trie.boggleable = boggleable_flags(trie)
+    assert trie.boggleable == bytes([0, 0, 1, 1])  # bookkeeper, fork, quiet, quite
+    assert lookup("Quiet", trie) is True
+    assert lookup("fork", trie) is False
+    updated = trie.with_delta(added=["sweater"], removed=["quite"])
+    assert lookup("sweater", updated) is True
+    assert lookup("quite", updated) is True
+    assert lookup("qat", updated) is False
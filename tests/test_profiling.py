@@ -0,0 +1,53 @@
+import pstats
+import tracemalloc
+
+import pytest
+from click.testing import CliRunner
+
+import boggle
+import is_boggleable
+from profiling import Profiler
+
+
+def test_no_mode_profiles_nothing(tmp_path):
+    with Profiler(None, str(tmp_path / "p")) as profiler:
+        profiler.mark("load")
+    assert profiler.files == []
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        Profiler("disk")
+
+
+def test_cpu_profile_writes_pstats(tmp_path):
+    with Profiler("cpu", str(tmp_path / "p")) as profiler:
+        boggle.Boggle(letters="catsdogsbirdfish").find_words()
+    assert profiler.files == [str(tmp_path / "p.pstats")]
+    functions = {name for _, _, name in pstats.Stats(profiler.files[0]).stats}
+    assert {"find_words", "search_word"} <= functions
+
+
+def test_mem_profile_writes_snapshots(tmp_path):
+    with Profiler("mem", str(tmp_path / "p")) as profiler:
+        profiler.mark("load")
+        profiler.mark("solve")
+    assert profiler.files == [str(tmp_path / "p-load.snapshot"), str(tmp_path / "p-solve.snapshot")]
+    assert not tracemalloc.is_tracing()
+    tracemalloc.Snapshot.load(profiler.files[0])
+
+
+def test_boggle_cli_profile(tmp_path):
+    out = str(tmp_path / "run")
+    result = CliRunner().invoke(boggle.cli, ["--profile", "cpu", "--profile-out", out, "catsdogsbirdfish"])
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / "run.pstats").exists()
+
+
+def test_is_boggleable_cli_profile(tmp_path):
+    out = str(tmp_path / "run")
+    result = CliRunner().invoke(is_boggleable.cli, ["--profile", "mem", "--profile-out", out, "quiet"])
+    assert result.exit_code == 0, result.output
+    assert "True" in result.output
+    assert (tmp_path / "run-end.snapshot").exists()
@@ -0,0 +1,88 @@
+import pytest
+
+import result_codec
+from result_codec import decode, decode_words, encode, encode_words
+from trie import Trie
+
+
+@pytest.fixture
+def trie():
+    trie = Trie()
+    trie.insert_words(["quiet", "her", "hero", "heros", "apple", "zebra"])
+    trie.assign_word_ids()
+    return trie
+
+
+@pytest.mark.parametrize("layout", ["array", "bitset", "auto"])
+@pytest.mark.parametrize("ids", [[], [0], [3, 1, 2], [0, 127, 128, 16_383, 16_384, 170_000]])
+def test_round_trip(layout, ids):
+    assert decode(encode(ids, 172_000, layout)) == sorted(ids)
+
+
+def test_duplicate_ids_are_stored_once():
+    assert decode(encode([5, 5, 2], layout="array")) == [2, 5]
+
+
+def test_auto_picks_smaller_layout():
+    dense = list(range(0, 100, 2))
+    sparse = [10, 50_000, 90_000]
+    assert len(encode(dense, 100)) == len(encode(dense, 100, "bitset"))
+    assert len(encode(sparse, 100_000)) == len(encode(sparse, 100_000, "array"))
+
+
+def test_array_gaps_fit_in_few_bytes():
+    blob = encode(range(0, 100_000, 1000), layout="array")
+    assert len(blob) == result_codec.HEADER.size + 100 * 2 - 1  # first gap is 0
+
+
+def test_bitset_needs_universe():
+    with pytest.raises(ValueError, match="dictionary size"):
+        encode([1], layout="bitset")
+
+
+def test_unknown_layout():
+    with pytest.raises(ValueError, match="Unknown layout"):
+        encode([1], layout="zip")
+
+
+def test_rejects_foreign_data():
+    with pytest.raises(ValueError, match="Not an encoded"):
+        decode(b"XYZ\x01\x00\x00\x00\x00\x00")
+
+
+def test_rejects_unknown_version():
+    blob = bytearray(encode([1, 2]))
+    blob[3] = 99
+    with pytest.raises(ValueError, match="version 99"):
+        decode(bytes(blob))
+
+
+def test_words_round_trip(trie):
+    blob = encode_words(["hero", "quiet", "apple"], trie)
+    assert decode_words(blob, trie) == ["apple", "hero", "quiet"]
+
+
+def test_unknown_word_is_named(trie):
+    with pytest.raises(ValueError, match="'zoo' has no word ID"):
+        encode_words(["hero", "zoo"], trie)
+
+
+def test_words_from_another_dictionary_build_are_rejected(trie):
+    blob = encode_words(["hero", "quiet"], trie)
+    rebuilt = Trie()
+    rebuilt.insert_words(["quiet", "her", "hero", "heros", "apple", "zebra", "aardvark"])
+    rebuilt.assign_word_ids()
+    assert rebuilt.fingerprint != trie.fingerprint
+    with pytest.raises(ValueError, match="encoded with dictionary"):
+        decode_words(blob, rebuilt)
+
+
+def test_incremental_updates_keep_the_fingerprint(trie):
+    old_blob = encode_words(["hero"], trie)
+    updated = trie.with_delta(added=["zoo"], removed=["heros"])
+    assert updated.fingerprint == trie.fingerprint
+    assert decode_words(old_blob, updated) == ["hero"]
+    new_blob = encode_words(["zoo"], updated)
+    assert decode_words(new_blob, updated) == ["zoo"]
+    with pytest.raises(ValueError, match="word IDs"):
+        decode_words(new_blob, trie)
@@ -0,0 +1,83 @@
+import pytest
+
+from boggle import Boggle
+from session import GameRound, SessionManager, Submission
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def game_round(clock):
+    return GameRound(Boggle(letters="lntoeprostienesi"), duration=60, clock=clock)
+
+
+# --- GameRound ---
+
+def test_answers_are_solved_once(game_round):
+    assert game_round.answers == Boggle(letters="lntoeprostienesi").find_words()
+
+
+def test_accepted_word_scores(game_round):
+    assert game_round.submit("ann", "Lento ") == Submission("lento", "accepted", 2)
+
+
+def test_invalid_word(game_round):
+    assert game_round.submit("ann", "zebra") == Submission("zebra", "invalid", 0)
+
+
+def test_repeat_by_same_player(game_round):
+    game_round.submit("ann", "lento")
+    assert game_round.submit("ann", "lento").status == "repeat"
+
+
+def test_shared_word_scores_nothing_for_anyone(game_round):
+    game_round.submit("ann", "lento")
+    game_round.submit("ann", "pro")
+    assert game_round.submit("bob", "lento") == Submission("lento", "shared", 0)
+    assert game_round.scores() == {"ann": 1, "bob": 0}
+
+
+def test_closed_round_rejects_words(game_round, clock):
+    clock.now += 61
+    assert game_round.submit("ann", "lento").status == "closed"
+
+
+def test_missed_words(game_round):
+    game_round.submit("ann", "lento")
+    assert game_round.missed() == game_round.answers - {"lento"}
+
+
+# --- SessionManager ---
+
+def test_manager_runs_independent_rounds(clock):
+    manager = SessionManager(duration=60, linger=30, clock=clock)
+    first = manager.start_round("lntoeprostienesi")
+    second = manager.start_round("toessinelreixdly")
+    assert first != second
+    assert manager.submit(first, "ann", "lento").status == "accepted"
+    assert manager.submit(second, "ann", "lento").status == "invalid"
+
+
+def test_manager_expires_finished_rounds(clock):
+    manager = SessionManager(duration=60, linger=30, clock=clock)
+    old = manager.start_round("lntoeprostienesi")
+    clock.now += 50
+    new = manager.start_round("toessinelreixdly")
+    clock.now += 20  # old round is over, but still within its linger time
+    assert manager.expire() == 0
+    clock.now += 25
+    assert manager.expire() == 1
+    with pytest.raises(KeyError):
+        manager.submit(old, "ann", "lento")
+    assert new in manager.rounds
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from boggle import Boggle
+from make_trie_dict import make_shards
+from sharded_dictionary import MANIFEST, ShardedDictionary
+from trie import Trie
+
+WORDS = ["cab", "abe", "fab", "bead", "quiet", "quit", "qi", "zebra"]
+
+
+@pytest.fixture
+def shard_dir(tmp_path):
+    words_file = tmp_path / "words.txt"
+    words_file.write_text("\n".join(WORDS))
+    make_shards(words_file, tmp_path / "shards", workers=2)
+    return tmp_path / "shards"
+
+
+def test_make_shards_writes_one_file_per_first_letter(shard_dir):
+    manifest = json.loads((shard_dir / MANIFEST).read_text())
+    assert sorted(manifest["shards"]) == ["a", "b", "c", "f", "qu", "z"]
+    assert manifest["shards"]["qu"] == {"file": "qu.pkl", "words": 2}
+
+
+def test_for_letters_holds_only_matching_words(shard_dir):
+    trie = ShardedDictionary(shard_dir).for_letters({"c", "qu", "x"})
+    assert sorted(trie.words()) == ["cab", "quiet", "quit"]
+    assert len(trie) == 3 and trie.count() == 3
+    assert trie.frozen
+
+
+def test_cache_is_bounded(shard_dir):
+    shards = ShardedDictionary(shard_dir, cache_size=2)
+    shards.for_letters({"a", "b", "c"})
+    assert list(shards.cache) == ["b", "c"]
+    assert shards.load_shard("c") is shards.cache["c"]
+
+
+def test_rejects_unknown_version(shard_dir):
+    (shard_dir / MANIFEST).write_text(json.dumps({"version": 99, "shards": {}}))
+    with pytest.raises(ValueError, match="version 99"):
+        ShardedDictionary(shard_dir)
+
+
+def test_boggle_with_shards_matches_full_dictionary(shard_dir):
+    full = Trie()
+    full.insert_words(WORDS)
+    game = Boggle(size=3, letters="cabfedzeb", dictionary=ShardedDictionary(shard_dir))
+    reference = Boggle(size=3, letters="cabfedzeb", dictionary=full)
+    assert sorted(game.dictionary.root.children) == ["a", "b", "c", "f", "z"]
+    assert game.find_words() == reference.find_words() == {"cab", "abe", "fab", "bead"}
+
+
+def test_board_with_no_matching_shards_gets_an_empty_dictionary(shard_dir):
+    game = Boggle(size=2, letters="xyxy", dictionary=ShardedDictionary(shard_dir))
+    assert len(game.dictionary) == 0
+    assert game.find_words() == set()
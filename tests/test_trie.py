@@ -172,3 +172,192 @@ def test_empty_trie_serialization(trie, tmp_path):
     trie.save_to_file(str(pkl))
     loaded = Trie.load_from_file(str(pkl))
     assert not loaded
+
+
+# --- len ---
+
+def test_len_counts_distinct_words(trie):
+    assert len(trie) == 0
+    trie.insert_words(["her", "hero", "her", "qi"])
+    assert len(trie) == 2
+
+
+# --- freeze ---
+
+def test_frozen_trie_rejects_inserts(trie):
+    trie.insert("hello")
+    assert trie.freeze() is trie
+    with pytest.raises(TypeError, match="frozen"):
+        trie.insert("world")
+    assert trie.search("hello") is True
+    assert trie.search("world") is False
+
+
+# --- word IDs ---
+
+def test_assign_word_ids_in_sorted_order(trie):
+    trie.insert_words(["quiet", "her", "hero", "apple"])
+    trie.assign_word_ids()
+    assert trie.word_list == ["apple", "her", "hero", "quiet"]
+    assert [trie.word_id(w) for w in trie.word_list] == [0, 1, 2, 3]
+
+
+def test_word_id_of_missing_word_or_prefix(trie):
+    trie.insert_words(["hero"])
+    trie.assign_word_ids()
+    assert trie.word_id("her") is None
+    assert trie.word_id("zebra") is None
+
+
+def test_word_ids_survive_serialization(trie, tmp_path):
+    trie.insert_words(["hello", "world", "quiet"])
+    trie.assign_word_ids()
+    pkl = tmp_path / "trie.pkl"
+    trie.save_to_file(str(pkl))
+    loaded = Trie.load_from_file(str(pkl))
+    assert loaded.word_list == trie.word_list
+    assert loaded.word_id("world") == trie.word_id("world")
+
+
+# --- remove and deltas ---
+
+def test_remove_word(trie):
+    trie.insert_words(["her", "hero", "heros"])
+    assert trie.remove("hero") is True
+    assert trie.search("hero") is False
+    assert trie.search("her") is True
+    assert trie.search("heros") is True
+    assert len(trie) == 2
+
+
+def test_remove_missing_word_or_prefix(trie):
+    trie.insert_words(["hero"])
+    assert trie.remove("her") is False
+    assert trie.remove("zebra") is False
+    assert trie.remove("qi") is False
+    assert trie.search("hero") is True
+
+
+def test_remove_prunes_empty_branches(trie):
+    trie.insert_words(["hello", "help"])
+    trie.remove("hello")
+    assert list(trie.root.children["h"].children["e"].children["l"].children) == ["p"]
+    trie.remove("help")
+    assert trie.root.children == {}
+    assert not trie
+
+
+def test_remove_keeps_shorter_words_on_the_path(trie):
+    trie.insert_words(["her", "heroes"])
+    trie.remove("heroes")
+    assert list(trie.words()) == ["her"]
+    assert trie.root.children["h"].children["e"].children["r"].children == {}
+
+
+def test_remove_retires_word_id(trie):
+    trie.insert_words(["apple", "hero", "quiet"])
+    trie.assign_word_ids()
+    trie.remove("hero")
+    trie.insert("zebra")
+    assert trie.word_list == ["apple", None, "quiet", "zebra"]
+    assert trie.word_id("quiet") == 2
+    assert trie.word_id("zebra") == 3
+
+
+def test_frozen_trie_rejects_removal(trie):
+    trie.insert("hello")
+    trie.freeze()
+    with pytest.raises(TypeError, match="frozen"):
+        trie.remove("hello")
+
+
+def test_apply_delta(trie):
+    trie.insert_words(["cat", "dog"])
+    trie.apply_delta(added=["cow", "cattle"], removed=["dog"])
+    assert sorted(trie.words()) == ["cat", "cattle", "cow"]
+
+
+def test_with_delta_leaves_original_untouched(trie):
+    trie.insert_words(["cat", "cattle", "dog", "quiet"])
+    trie.freeze()
+    updated = trie.with_delta(added=["cow", "quit"], removed=["cattle", "dog"])
+    assert sorted(trie.words()) == ["cat", "cattle", "dog", "quiet"]
+    assert sorted(updated.words()) == ["cat", "cow", "quiet", "quit"]
+    assert len(trie) == 4 and len(updated) == 4
+
+
+def test_with_delta_shares_unchanged_branches(trie):
+    trie.insert_words(["cat", "dog"])
+    updated = trie.with_delta(added=["cow"])
+    assert updated.root.children["d"] is trie.root.children["d"]
+    assert updated.root.children["c"] is not trie.root.children["c"]
+
+
+# --- counts, paging and anagrams ---
+
+def test_count_words_under_prefix(trie):
+    trie.insert_words(["her", "hero", "heros", "hi", "quiet", "quit"])
+    assert trie.count() == 6
+    assert trie.count("he") == 3
+    assert trie.count("hero") == 2
+    assert trie.count("qu") == 2
+    assert trie.count("x") == 0
+    assert trie.count("qz") == 0
+
+
+def test_count_follows_remove_and_with_delta(trie):
+    trie.insert_words(["cat", "cattle", "dog"])
+    trie.remove("cattle")
+    assert trie.count("ca") == 1
+    updated = trie.with_delta(added=["cap", "car"], removed=["dog"])
+    assert trie.count() == 2 and trie.count("ca") == 1
+    assert updated.count() == 3 and updated.count("ca") == 3
+
+
+def test_words_with_prefix(trie):
+    trie.insert_words(["her", "hero", "heros", "hi", "quiet"])
+    assert sorted(trie.words("her")) == ["her", "hero", "heros"]
+    assert list(trie.words("qu")) == ["quiet"]
+    assert list(trie.words("x")) == []
+
+
+def test_words_pages_match_full_listing(trie):
+    words = ["a", "ab", "abc", "abd", "b", "ba", "bad", "c", "cab", "quiet", "quit"]
+    trie.insert_words(words)
+    everything = list(trie.words())
+    assert sorted(everything) == words
+    pages = [list(trie.words(offset=offset, limit=3)) for offset in range(0, len(words), 3)]
+    assert sum(pages, []) == everything
+    assert list(trie.words(offset=len(words))) == []
+    assert list(trie.words(limit=0)) == []
+
+
+def test_words_handles_deep_words(trie):
+    word = "a" * 5000
+    trie.insert(word)
+    assert list(trie.words()) == [word]
+
+
+def test_anagrams(trie):
+    trie.insert_words(["stop", "pots", "tops", "spot", "post", "quiet", "quite", "sto"])
+    trie.build_anagram_index()
+    assert sorted(trie.anagrams("opts")) == ["post", "pots", "spot", "stop", "tops"]
+    assert sorted(trie.anagrams("TEQUI")) == ["quiet", "quite"]
+    assert trie.anagrams("xyz") == []
+
+
+def test_anagram_index_follows_updates(trie):
+    trie.insert_words(["stop", "pots"])
+    trie.build_anagram_index()
+    trie.insert("tops")
+    trie.remove("stop")
+    assert sorted(trie.anagrams("stop")) == ["pots", "tops"]
+    updated = trie.with_delta(added=["spot"], removed=["pots", "tops"])
+    assert updated.anagrams("stop") == ["spot"]
+    assert sorted(trie.anagrams("stop")) == ["pots", "tops"]
+
+
+def test_anagrams_without_index(trie):
+    trie.insert("stop")
+    with pytest.raises(ValueError, match="anagram index"):
+        trie.anagrams("stop")
@@ -11,7 +11,10 @@ A Trie is efficient for Boggle because it prunes entire branches of invalid pref
 rather than checking every word in the dictionary individually.
 """
 
+import copy
 import pickle
+import zlib
+from itertools import chain
 from helpers import normalize_qu
 import os
 from importlib import resources
@@ -19,23 +22,55 @@ from pathlib import Path
 
 
 class TrieNode:
-    """A single node in the trie, holding children and an end-of-word flag."""
+    """A single node in the trie, holding children and an end-of-word flag.
+
+    count is the number of words ending at or below this node.
+    """
+
+    # Set on end-of-word nodes by Trie.assign_word_ids. Kept as a class
+    # default so the many interior nodes don't each store a None.
+    word_id = None
 
     def __init__(self):
         self.children = {}
         self.is_end_of_word = False
+        self.count = 0
+
+
+def signature(letters):
+    """Return the anagram key of letters: its boggle-normalized chars in sorted order.
+
+    Raises ValueError for a Q not followed by U.
+    """
+    return "".join(sorted(normalize_qu(letters)))
 
 
 class Trie:
     """A prefix tree that stores words using boggle-normalized characters."""
 
+    # A frozen trie rejects inserts, so one copy can be shared between threads.
+    frozen = False
+    # One byte per word ID, 1 if the dice can spell the word; set by make_trie_dict.py.
+    boggleable = None
+    # Hash of word_list as numbered by assign_word_ids; identifies the build
+    # that a list of word IDs refers to. Later inserts and removals keep it,
+    # since they leave existing IDs alone.
+    fingerprint = 0
+
     def __init__(self):
         self.root = TrieNode()
+        self.word_count = 0
+        self.word_list = []  # word_list[word_id] -> word, once IDs are assigned
+        self.anagram_index = None  # signature -> words, once the index is built
 
     def __bool__(self):
         """Return True if the trie contains any words."""
         return bool(self.root.children)
 
+    def __len__(self):
+        """Return the number of words in the trie."""
+        return self.word_count
+
     def _walk(self, word):
         """Walk the trie along the boggle-normalized chars of word.
 
@@ -51,22 +86,177 @@ class Trie:
 
     def insert(self, word):
         """Add a word to the trie, silently skipping words with Q not followed by U."""
+        if self.frozen:
+            raise TypeError("Cannot insert into a frozen Trie")
         try:
             chars = list(normalize_qu(word))
         except ValueError:
             return
-        current_node = self.root
+        path = [self.root]
         for char in chars:
+            current_node = path[-1]
             if char not in current_node.children:
                 current_node.children[char] = TrieNode()
-            current_node = current_node.children[char]
-        current_node.is_end_of_word = True
+            path.append(current_node.children[char])
+        end = path[-1]
+        if not end.is_end_of_word:
+            end.is_end_of_word = True
+            self.word_count += 1
+            for node in path:
+                node.count += 1
+            word = "".join(chars)
+            if self.word_list:
+                # Keep existing IDs stable: a word added later gets the next free ID.
+                end.word_id = len(self.word_list)
+                self.word_list.append(word)
+            if self.anagram_index is not None:
+                # Lists are replaced, never mutated, so with_delta can share them.
+                key = signature(word)
+                self.anagram_index[key] = self.anagram_index.get(key, []) + [word]
 
     def insert_words(self, words):
         """Insert each word from an iterable into the trie."""
         for word in words:
             self.insert(word)
 
+    def remove(self, word):
+        """Remove a word, pruning branches left with no words. Return True if it was present.
+
+        The word's ID, if it had one, is retired rather than reused.
+        """
+        if self.frozen:
+            raise TypeError("Cannot remove from a frozen Trie")
+        try:
+            chars = list(normalize_qu(word))
+        except ValueError:
+            return False
+        path = [self.root]
+        for char in chars:
+            if char not in path[-1].children:
+                return False
+            path.append(path[-1].children[char])
+        end = path[-1]
+        if not end.is_end_of_word:
+            return False
+
+        end.is_end_of_word = False
+        self.word_count -= 1
+        for node in path:
+            node.count -= 1
+        if end.word_id is not None:
+            self.word_list[end.word_id] = None
+            end.word_id = None
+        word = "".join(chars)
+        key = signature(word)
+        if self.anagram_index and key in self.anagram_index:
+            remaining = [other for other in self.anagram_index[key] if other != word]
+            if remaining:
+                self.anagram_index[key] = remaining
+            else:
+                del self.anagram_index[key]
+
+        for depth in range(len(chars), 0, -1):
+            node = path[depth]
+            if node.children or node.is_end_of_word:
+                break
+            del path[depth - 1].children[chars[depth - 1]]
+        return True
+
+    def apply_delta(self, added=(), removed=()):
+        """Remove and then add words in place."""
+        for word in removed:
+            self.remove(word)
+        self.insert_words(added)
+
+    def with_delta(self, added=(), removed=()):
+        """Return a new trie with words added and removed, leaving this one untouched.
+
+        Only the nodes on the changed words' paths are copied; every other
+        node is shared with this trie. That makes an update cheap, and
+        anyone still searching this trie (even a frozen one) is unaffected.
+        """
+        updated = copy.copy(self)
+        updated.frozen = False
+        updated.word_list = list(self.word_list)
+        if self.anagram_index is not None:
+            updated.anagram_index = dict(self.anagram_index)
+        updated.root = copy.copy(self.root)
+        updated.root.children = dict(self.root.children)
+        copied = {id(updated.root)}
+        for word in chain(added, removed):
+            updated._copy_path(word, copied)
+        updated.apply_delta(added, removed)
+        return updated
+
+    def _copy_path(self, word, copied):
+        """Replace shared nodes along word's path with private copies."""
+        try:
+            chars = list(normalize_qu(word))
+        except ValueError:
+            return
+        node = self.root
+        for char in chars:
+            child = node.children.get(char)
+            if child is None:
+                return
+            if id(child) not in copied:
+                child = copy.copy(child)
+                child.children = dict(child.children)
+                node.children[char] = child
+                copied.add(id(child))
+            node = child
+
+    def assign_word_ids(self):
+        """Number the words in sorted order, storing each ID on its end node.
+
+        IDs are stable for a given word list, so results encoded as IDs by
+        one process can be decoded by any other using the same dictionary.
+        """
+        self.word_list = sorted(self.words())
+        for word_id, word in enumerate(self.word_list):
+            self._walk(word).word_id = word_id
+        self.fingerprint = zlib.crc32("\n".join(self.word_list).encode())
+
+    def word_id(self, word):
+        """Return the ID of word, or None if it is not in the trie or IDs aren't assigned."""
+        node = self._walk(word)
+        if node is None or not node.is_end_of_word:
+            return None
+        return node.word_id
+
+    def build_anagram_index(self):
+        """Index the words by signature, so anagrams() is a single lookup."""
+        self.anagram_index = {}
+        # Reuse word_list's strings when there is one, so they are stored once.
+        for word in filter(None, self.word_list) if self.word_list else self.words():
+            self.anagram_index.setdefault(signature(word), []).append(word)
+
+    def anagrams(self, letters):
+        """Return the words that use exactly the given letters (tiles), each once.
+
+        'qu' counts as one tile, as on the dice.
+        """
+        if self.anagram_index is None:
+            raise ValueError("Dictionary has no anagram index; rebuild it with make_trie_dict.py")
+        try:
+            key = signature(letters.lower())
+        except ValueError:
+            return []
+        return list(self.anagram_index.get(key, ()))
+
+    def count(self, prefix=""):
+        """Return how many words start with prefix, in O(len(prefix))."""
+        try:
+            node = self._walk(prefix)
+        except ValueError:
+            return 0
+        return node.count if node else 0
+
+    def freeze(self):
+        """Make the trie read-only and return it."""
+        self.frozen = True
+        return self
+
     def search(self, word):
         """Return True if word is in the trie, False if not."""
         node = self._walk(word)
@@ -74,16 +264,34 @@ class Trie:
             return False
         return node.is_end_of_word
 
-    def words(self):
-        """Yield all words stored in the trie."""
+    def words(self, prefix="", offset=0, limit=None):
+        """Yield the words starting with prefix, skipping the first offset.
 
-        def _collect(node, prefix):
+        Stops after limit words if a limit is given. The order is the same
+        for every call, so offset and limit page through the results.
+        Whole branches with no more than offset words are skipped by their
+        counts rather than walked.
+        """
+        try:
+            node = self._walk(prefix)
+        except ValueError:
+            return
+        if node is None:
+            return
+        stack = [("".join(normalize_qu(prefix)), node)]
+        while stack and limit != 0:
+            text, node = stack.pop()
+            if offset >= node.count:
+                offset -= node.count
+                continue
             if node.is_end_of_word:
-                yield prefix
-            for char, child in node.children.items():
-                yield from _collect(child, prefix + char)
-
-        yield from _collect(self.root, "")
+                if offset:
+                    offset -= 1
+                else:
+                    yield text
+                    if limit is not None:
+                        limit -= 1
+            stack.extend((text + char, child) for char, child in reversed(node.children.items()))
 
     def display(self):
         """Print all words in the trie, one per line."""